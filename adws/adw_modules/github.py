@@ -9,17 +9,29 @@ This module contains all GitHub-related operations including:
 - Issue status management
 """
 
+import functools
 import subprocess
 import sys
 import os
+import threading
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
 from adw_modules.data_types import GitHubIssue, GitHubIssueListItem, GitHubComment
+from adw_modules import github_cache
 
 # Bot identifier to prevent webhook loops and filter bot comments
 ADW_BOT_IDENTIFIER = "[ADW-AGENTS]"
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Shared REST API session (see _get_api_session)
+_api_session = None
+_api_session_token: Optional[str] = None
+_api_session_lock = threading.Lock()
+
 
 def get_github_env() -> Optional[dict]:
     """Get environment with GitHub token set up. Returns None if no GITHUB_PAT."""
@@ -34,8 +46,12 @@ def get_github_env() -> Optional[dict]:
     return env
 
 
+@functools.lru_cache(maxsize=1)
 def get_repo_url() -> str:
-    """Get GitHub repository URL from git remote."""
+    """Get GitHub repository URL from git remote.
+    
+    Cached for the life of the process; use get_repo_url.cache_clear() to reset.
+    """
     try:
         result = subprocess.run(
             ["git", "remote", "get-url", "origin"],
@@ -52,6 +68,7 @@ def get_repo_url() -> str:
         raise ValueError("git command not found. Please ensure git is installed.")
 
 
+@functools.lru_cache(maxsize=32)
 def extract_repo_path(github_url: str) -> str:
     """Extract repository path (owner/repo) from GitHub URL.
     
@@ -84,8 +101,177 @@ def extract_repo_path(github_url: str) -> str:
     raise ValueError(f"Could not extract repo path from URL: {github_url}")
 
 
+def get_issue_etag(
+    issue_number: str, repo_path: str, cached_etag: Optional[str] = None
+) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """Make a conditional REST request for an issue and return (status, etag, updated_at).
+    
+    The issue's ETag changes whenever the issue or its comments change. When
+    cached_etag is still current GitHub answers 304 Not Modified, which does
+    not count against the rate limit.
+    
+    Returns:
+        Tuple of (HTTP status code, ETag header, issue updated_at). updated_at
+        is only set for a 200 response. (None, None, None) if the request
+        could not be made or its response could not be parsed.
+    """
+    cmd = ["gh", "api", "-i", f"repos/{repo_path}/issues/{issue_number}"]
+    if cached_etag:
+        cmd[3:3] = ["-H", f"If-None-Match: {cached_etag}"]
+
+    try:
+        # gh exits non-zero for a 304, so parse the headers regardless of exit code
+        result = subprocess.run(cmd, capture_output=True, text=True, env=get_github_env())
+        lines = result.stdout.splitlines()
+        if not lines or not lines[0].startswith("HTTP/"):
+            return None, None, None
+        status = int(lines[0].split()[1])
+        etag = None
+        body_start = len(lines)
+        for i, line in enumerate(lines[1:], start=1):
+            if not line.strip():
+                body_start = i + 1
+                break
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "etag":
+                etag = value.strip()
+        updated_at = None
+        if status == 200:
+            try:
+                updated_at = json.loads("\n".join(lines[body_start:])).get("updated_at")
+            except (ValueError, AttributeError):
+                pass
+        return status, etag, updated_at
+    except (OSError, ValueError, IndexError):
+        return None, None, None
+
+
+def _filter_issue_data(issue_data: Dict) -> Dict:
+    """Convert `gh issue view --json` output to the GitHubIssue model structure.
+    
+    Only includes fields that exist in GitHubIssue, GitHubComment, GitHubUser models.
+    """
+    filtered_issue = {}
+    
+    # Basic issue fields
+    if "number" in issue_data:
+        filtered_issue["number"] = issue_data["number"]
+    if "title" in issue_data:
+        filtered_issue["title"] = issue_data["title"]
+    if "body" in issue_data:
+        filtered_issue["body"] = issue_data["body"]
+    if "state" in issue_data:
+        filtered_issue["state"] = issue_data["state"]
+    if "url" in issue_data:
+        filtered_issue["url"] = issue_data["url"]
+    
+    # Convert date fields (camelCase -> snake_case)
+    if "createdAt" in issue_data:
+        filtered_issue["created_at"] = issue_data["createdAt"]
+    if "updatedAt" in issue_data:
+        filtered_issue["updated_at"] = issue_data["updatedAt"]
+    if "closedAt" in issue_data:
+        filtered_issue["closed_at"] = issue_data["closedAt"]
+    
+    # Author field
+    if "author" in issue_data:
+        author = issue_data["author"]
+        filtered_issue["author"] = {
+            "login": author.get("login"),
+            "id": author.get("id"),
+            "name": author.get("name"),
+            "is_bot": author.get("isBot", False),
+        }
+    
+    # Assignees
+    if "assignees" in issue_data:
+        filtered_issue["assignees"] = [
+            {
+                "login": a.get("login"),
+                "id": a.get("id"),
+                "name": a.get("name"),
+                "is_bot": a.get("isBot", False),
+            }
+            for a in issue_data["assignees"]
+        ]
+    
+    # Labels
+    if "labels" in issue_data:
+        filtered_issue["labels"] = [
+            {
+                "id": l.get("id"),
+                "name": l.get("name"),
+                "color": l.get("color"),
+                "description": l.get("description"),
+            }
+            for l in issue_data["labels"]
+        ]
+    
+    # Comments - filter and convert
+    if "comments" in issue_data:
+        filtered_comments = []
+        for comment in issue_data["comments"]:
+            filtered_comment = {
+                "id": comment.get("id"),
+                "body": comment.get("body"),
+            }
+            # Convert date fields
+            if "createdAt" in comment:
+                filtered_comment["created_at"] = comment["createdAt"]
+            if "updatedAt" in comment:
+                filtered_comment["updated_at"] = comment["updatedAt"]
+            # Author in comment
+            if "author" in comment:
+                author = comment["author"]
+                filtered_comment["author"] = {
+                    "login": author.get("login"),
+                    "id": author.get("id"),
+                    "name": author.get("name"),
+                    "is_bot": author.get("isBot", False),
+                }
+            filtered_comments.append(filtered_comment)
+        filtered_issue["comments"] = filtered_comments
+    
+    # Milestone
+    if "milestone" in issue_data and issue_data["milestone"]:
+        milestone = issue_data["milestone"]
+        filtered_issue["milestone"] = {
+            "id": milestone.get("id"),
+            "number": milestone.get("number"),
+            "title": milestone.get("title"),
+            "state": milestone.get("state"),
+            "description": milestone.get("description"),
+        }
+    
+    return filtered_issue
+
+
 def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
-    """Fetch GitHub issue using gh CLI and return typed model."""
+    """Fetch GitHub issue using gh CLI and return typed model.
+    
+    When the issue is cached, a conditional request is made first; if the
+    issue is unchanged since the last fetch (304 Not Modified, or a 200 with
+    the same updated_at), the cached issue is returned without a full fetch.
+    With nothing cached the full fetch is made directly and its result is
+    cached without an ETag, which the next fetch fills in.
+    """
+    cache_key = github_cache.issue_cache_key(repo_path, issue_number)
+    cached = github_cache.get_cached(cache_key)
+    status = etag = None
+    if cached:
+        cached_etag, cached_body = cached
+        status, etag, updated_at = get_issue_etag(issue_number, repo_path, cached_etag or None)
+        try:
+            cached_issue = json.loads(cached_body)
+            if status == 304 or (
+                status == 200 and updated_at and updated_at == cached_issue.get("updated_at")
+            ):
+                if status == 200 and etag:
+                    github_cache.store(cache_key, etag, cached_body)
+                return GitHubIssue.from_dict(cached_issue)
+        except Exception:
+            pass  # Fall back to a full fetch
+
     cmd = [
         "gh",
         "issue",
@@ -104,101 +290,12 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
 
         if result.returncode == 0:
             issue_data = json.loads(result.stdout)
-            # Filter and convert GitHub API data to match our model structure
-            # Only include fields that exist in GitHubIssue, GitHubComment, GitHubUser models
-            filtered_issue = {}
-            
-            # Basic issue fields
-            if "number" in issue_data:
-                filtered_issue["number"] = issue_data["number"]
-            if "title" in issue_data:
-                filtered_issue["title"] = issue_data["title"]
-            if "body" in issue_data:
-                filtered_issue["body"] = issue_data["body"]
-            if "state" in issue_data:
-                filtered_issue["state"] = issue_data["state"]
-            if "url" in issue_data:
-                filtered_issue["url"] = issue_data["url"]
-            
-            # Convert date fields (camelCase -> snake_case)
-            if "createdAt" in issue_data:
-                filtered_issue["created_at"] = issue_data["createdAt"]
-            if "updatedAt" in issue_data:
-                filtered_issue["updated_at"] = issue_data["updatedAt"]
-            if "closedAt" in issue_data:
-                filtered_issue["closed_at"] = issue_data["closedAt"]
-            
-            # Author field
-            if "author" in issue_data:
-                author = issue_data["author"]
-                filtered_issue["author"] = {
-                    "login": author.get("login"),
-                    "id": author.get("id"),
-                    "name": author.get("name"),
-                    "is_bot": author.get("isBot", False),
-                }
-            
-            # Assignees
-            if "assignees" in issue_data:
-                filtered_issue["assignees"] = [
-                    {
-                        "login": a.get("login"),
-                        "id": a.get("id"),
-                        "name": a.get("name"),
-                        "is_bot": a.get("isBot", False),
-                    }
-                    for a in issue_data["assignees"]
-                ]
-            
-            # Labels
-            if "labels" in issue_data:
-                filtered_issue["labels"] = [
-                    {
-                        "id": l.get("id"),
-                        "name": l.get("name"),
-                        "color": l.get("color"),
-                        "description": l.get("description"),
-                    }
-                    for l in issue_data["labels"]
-                ]
-            
-            # Comments - filter and convert
-            if "comments" in issue_data:
-                filtered_comments = []
-                for comment in issue_data["comments"]:
-                    filtered_comment = {
-                        "id": comment.get("id"),
-                        "body": comment.get("body"),
-                    }
-                    # Convert date fields
-                    if "createdAt" in comment:
-                        filtered_comment["created_at"] = comment["createdAt"]
-                    if "updatedAt" in comment:
-                        filtered_comment["updated_at"] = comment["updatedAt"]
-                    # Author in comment
-                    if "author" in comment:
-                        author = comment["author"]
-                        filtered_comment["author"] = {
-                            "login": author.get("login"),
-                            "id": author.get("id"),
-                            "name": author.get("name"),
-                            "is_bot": author.get("isBot", False),
-                        }
-                    filtered_comments.append(filtered_comment)
-                filtered_issue["comments"] = filtered_comments
-            
-            # Milestone
-            if "milestone" in issue_data and issue_data["milestone"]:
-                milestone = issue_data["milestone"]
-                filtered_issue["milestone"] = {
-                    "id": milestone.get("id"),
-                    "number": milestone.get("number"),
-                    "title": milestone.get("title"),
-                    "state": milestone.get("state"),
-                    "description": milestone.get("description"),
-                }
-            
+            filtered_issue = _filter_issue_data(issue_data)
             issue = GitHubIssue.from_dict(filtered_issue)
+            if status == 200 and etag:
+                github_cache.store(cache_key, etag, json.dumps(filtered_issue))
+            elif not cached:
+                github_cache.store(cache_key, "", json.dumps(filtered_issue))
             return issue
         else:
             print(result.stderr, file=sys.stderr)
@@ -216,8 +313,47 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
         sys.exit(1)
 
 
+def _get_api_session(token: str) -> requests.Session:
+    """Return the shared GitHub API session for token, creating it if needed.
+
+    The session keeps connections to api.github.com alive between calls, so
+    repeated comments skip the TLS handshake.
+    """
+    global _api_session, _api_session_token
+    with _api_session_lock:
+        if _api_session is None or _api_session_token != token:
+            session = requests.Session()
+            session.headers.update({
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            })
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            _api_session, _api_session_token = session, token
+        return _api_session
+
+
+def _post_issue_comment_api(issue_id: str, comment: str, repo_path: str, token: str) -> None:
+    """Post an issue comment through the GitHub REST API."""
+    url = f"{GITHUB_API_URL}/repos/{repo_path}/issues/{issue_id}/comments"
+    try:
+        response = _get_api_session(token).post(url, json={"body": comment}, timeout=30)
+    except requests.exceptions.RequestException as e:
+        print(f"Error posting comment: {e}", file=sys.stderr)
+        raise RuntimeError(f"Failed to post comment: {e}")
+
+    if response.status_code == 201:
+        print(f"Successfully posted comment to issue #{issue_id}")
+    else:
+        print(f"Error posting comment: {response.status_code} {response.text}", file=sys.stderr)
+        raise RuntimeError(f"Failed to post comment: {response.status_code} {response.text}")
+
+
 def make_issue_comment(issue_id: str, comment: str, repo_path: Optional[str] = None) -> None:
-    """Post a comment to a GitHub issue using gh CLI.
+    """Post a comment to a GitHub issue.
+    
+    Uses the GitHub REST API over a shared keep-alive session.
     
     Args:
         issue_id: Issue number as string
@@ -236,35 +372,11 @@ def make_issue_comment(issue_id: str, comment: str, repo_path: Optional[str] = N
     if not comment.startswith(ADW_BOT_IDENTIFIER):
         comment = f"{ADW_BOT_IDENTIFIER} {comment}"
 
-    cmd = [
-        "gh",
-        "issue",
-        "comment",
-        issue_id,
-        "-R",
-        repo_path,
-        "--body",
-        comment,
-    ]
-
     env = get_github_env()
     if not env:
         raise ValueError("GITHUB_PAT not set. Cannot post comment without authentication.")
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-
-        if result.returncode == 0:
-            print(f"Successfully posted comment to issue #{issue_id}")
-        else:
-            print(f"Error posting comment: {result.stderr}", file=sys.stderr)
-            raise RuntimeError(f"Failed to post comment: {result.stderr}")
-    except FileNotFoundError:
-        print("Error: GitHub CLI (gh) is not installed.", file=sys.stderr)
-        raise RuntimeError("GitHub CLI (gh) not found. Please install it: https://cli.github.com/")
-    except Exception as e:
-        print(f"Error posting comment: {e}", file=sys.stderr)
-        raise
+    _post_issue_comment_api(issue_id, comment, repo_path, env["GH_TOKEN"])
 
 
 def mark_issue_in_progress(issue_id: str) -> None:
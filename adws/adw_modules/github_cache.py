@@ -0,0 +1,50 @@
+"""Persistent ETag cache for GitHub API responses.
+
+Stores the last ETag and response body per key so that repeated fetches can
+send If-None-Match and reuse the cached body on a 304, which does not count
+against the GitHub rate limit.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+from typing import Optional, Tuple
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "adw", "github_etags.db")
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it if needed."""
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS etags (key TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL)"
+    )
+    return conn
+
+
+def issue_cache_key(repo_path: str, issue_number: str) -> str:
+    """Build the cache key for a single issue."""
+    return f"{repo_path}:issue:{issue_number}"
+
+
+def get_cached(key: str) -> Optional[Tuple[str, str]]:
+    """Return (etag, body) for key, or None if not cached or unreadable."""
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute("SELECT etag, body FROM etags WHERE key = ?", (key,)).fetchone()
+        return (row[0], row[1]) if row else None
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def store(key: str, etag: str, body: str) -> None:
+    """Store the ETag and body for key. Failures are ignored."""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO etags (key, etag, body) VALUES (?, ?, ?)",
+                (key, etag, body),
+            )
+    except (sqlite3.Error, OSError):
+        pass
@@ -0,0 +1,52 @@
+"""Background queue for posting GitHub issue comments.
+
+Progress comments are handed to a single daemon thread that posts them in
+order, so workflows do not block on the GitHub round-trip. Pending comments
+are flushed at interpreter exit, including exits through sys.exit().
+"""
+
+import atexit
+import queue
+import sys
+import threading
+from typing import Optional, Tuple
+
+from adw_modules.github import make_issue_comment
+
+_comment_queue: "queue.Queue[Tuple[str, str, Optional[str]]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _post_comments() -> None:
+    """Worker loop: post queued comments one at a time."""
+    while True:
+        issue_number, comment, repo_path = _comment_queue.get()
+        try:
+            make_issue_comment(issue_number, comment, repo_path)
+        except Exception as e:
+            print(f"Error posting queued comment: {e}", file=sys.stderr)
+        finally:
+            _comment_queue.task_done()
+
+
+def enqueue_comment(issue_number: str, comment: str, repo_path: Optional[str] = None) -> None:
+    """Queue a comment to be posted to a GitHub issue in the background.
+
+    Args:
+        issue_number: Issue number as string
+        comment: Comment body to post
+        repo_path: Optional repository path (owner/repo)
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_post_comments, name="adw-comment-queue", daemon=True)
+            _worker.start()
+            atexit.register(flush_comments)
+    _comment_queue.put((issue_number, comment, repo_path))
+
+
+def flush_comments() -> None:
+    """Block until every queued comment has been posted."""
+    _comment_queue.join()
@@ -3,14 +3,16 @@
 import os
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from rococo.models import BaseModel
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from requests.auth import HTTPBasicAuth
 except ImportError:
     requests = None
+    HTTPAdapter = None
     HTTPBasicAuth = None
 
 
@@ -71,6 +73,15 @@ class SonarQubeClient:
                 "SonarQube base URL not provided. Set SONARQUBE_URL environment variable."
             )
 
+        # One keep-alive connection reused for every request from this client
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if self.token:
+            # SonarQube tokens can be used as basic auth with empty username
+            self.session.auth = HTTPBasicAuth(self.token, "")
+
     def _make_request(
         self, endpoint: str, params: Optional[Dict] = None
     ) -> Optional[Dict]:
@@ -85,14 +96,8 @@ class SonarQubeClient:
         """
         url = f"{self.base_url}{endpoint}"
 
-        # Use token authentication if available
-        auth = None
-        if self.token:
-            # SonarQube tokens can be used as basic auth with empty username
-            auth = HTTPBasicAuth(self.token, "")
-
         try:
-            response = requests.get(url, params=params, auth=auth, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
 
             if response.status_code == 200:
                 return response.json()
@@ -197,12 +202,35 @@ class SonarQubeClient:
             self.logger.error(f"Error parsing file coverage: {e}")
             return None
 
-    def get_all_files(self) -> List[str]:
+    def get_all_files(self, path_prefixes: Optional[Sequence[str]] = None) -> List[str]:
         """Get list of all files in the project.
 
+        Args:
+            path_prefixes: Optional directory prefixes (e.g. 'flask/'). When
+                given, only files under these directories are listed, by
+                querying each directory's component tree on the server.
+
         Returns:
             List of file keys
         """
+        if path_prefixes:
+            file_keys = []
+            for prefix in path_prefixes:
+                directory_key = f"{self.project_key}:{prefix.rstrip('/')}"
+                data = self._make_request(
+                    "/api/components/tree",
+                    {"component": directory_key, "qualifiers": "FIL"},
+                )
+                if data is None:
+                    # Directory lookup not supported/found; filter client-side
+                    return [
+                        key
+                        for key in self.get_all_files()
+                        if key.replace(f"{self.project_key}:", "").startswith(tuple(path_prefixes))
+                    ]
+                file_keys.extend(comp["key"] for comp in data.get("components", []))
+            return file_keys
+
         params = {
             "component": self.project_key,
             "qualifiers": "FIL",
@@ -220,18 +248,21 @@ class SonarQubeClient:
             return []
 
     def get_uncovered_files(
-        self, min_coverage: float = 100.0
+        self,
+        min_coverage: float = 100.0,
+        path_prefixes: Optional[Sequence[str]] = None,
     ) -> List[CoverageFile]:
         """Get all files with coverage less than min_coverage.
 
         Args:
             min_coverage: Minimum coverage threshold (default: 100.0 for 100%)
+            path_prefixes: Optional directory prefixes to limit the search to
 
         Returns:
             List of CoverageFile objects for uncovered files
         """
         uncovered_files = []
-        file_keys = self.get_all_files()
+        file_keys = self.get_all_files(path_prefixes)
 
         self.logger.info(f"Checking coverage for {len(file_keys)} files...")
 
@@ -276,15 +307,21 @@ Files Needing Coverage ({len(uncovered_files)}):
 
         return summary
 
-    def get_uncovered_files_summary(self) -> str:
-        """Get a summary of uncovered files formatted for Claude Code.
+    def get_uncovered_files_dict(
+        self, path_prefixes: Optional[Sequence[str]] = None
+    ) -> Dict:
+        """Get a summary of uncovered files as a dict.
+
+        Args:
+            path_prefixes: Optional directory prefixes to limit the search to
 
         Returns:
-            JSON-formatted string with uncovered files and their uncovered lines
+            Dict with the number of uncovered files and, per file, its
+            coverage and uncovered lines
         """
-        uncovered_files = self.get_uncovered_files()
+        uncovered_files = self.get_uncovered_files(path_prefixes=path_prefixes)
 
-        summary_data = {
+        return {
             "total_uncovered_files": len(uncovered_files),
             "files": [
                 {
@@ -298,7 +335,12 @@ Files Needing Coverage ({len(uncovered_files)}):
             ],
         }
 
-        import json
+    def get_uncovered_files_summary(self) -> str:
+        """Get a summary of uncovered files formatted for Claude Code.
 
-        return json.dumps(summary_data, indent=2)
+        Returns:
+            JSON-formatted string with uncovered files and their uncovered lines
+        """
+        import json
 
+        return json.dumps(self.get_uncovered_files_dict(), indent=2)
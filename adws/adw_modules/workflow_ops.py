@@ -1,11 +1,15 @@
 """Shared AI Developer Workflow (ADW) operations."""
 
+import functools
 import glob
+import hashlib
 import json
 import logging
 import os
 import subprocess
 import re
+import threading
+from collections import OrderedDict
 from typing import Tuple, Optional
 from adw_modules.data_types import (
     AgentTemplateRequest,
@@ -45,18 +49,34 @@ AVAILABLE_ADW_WORKFLOWS = [
     "adw_sdlc_iso",
 ]
 
+# Recent classify_adw results keyed by SHA-256 of the classified text
+ADW_INFO_CACHE_SIZE = 256
+_adw_info_cache: "OrderedDict[str, ADWExtractionResult]" = OrderedDict()
+_adw_info_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _format_prefix(adw_id: str, agent_name: str, session_id: Optional[str] = None) -> str:
+    """Build the issue comment header for an ADW ID and agent."""
+    if session_id:
+        return f"{ADW_BOT_IDENTIFIER} {adw_id}_{agent_name}_{session_id}: "
+    return f"{ADW_BOT_IDENTIFIER} {adw_id}_{agent_name}: "
+
 
 def format_issue_message(
     adw_id: str, agent_name: str, message: str, session_id: Optional[str] = None
 ) -> str:
     """Format a message for issue comments with ADW tracking and bot identifier."""
-    if session_id:
-        return f"{ADW_BOT_IDENTIFIER} {adw_id}_{agent_name}_{session_id}: {message}"
-    return f"{ADW_BOT_IDENTIFIER} {adw_id}_{agent_name}: {message}"
+    return _format_prefix(adw_id, agent_name, session_id or None) + message
 
 
-def extract_adw_info(text: str, temp_adw_id: str) -> ADWExtractionResult:
-    """Extract ADW workflow, ID, and model_set from text using classify_adw agent."""
+def _classify_adw(text: str, temp_adw_id: str) -> Tuple[ADWExtractionResult, bool]:
+    """Run the classify_adw agent on text.
+
+    Returns:
+        Tuple of (result, cacheable). Results are cacheable when the agent
+        answered with parseable JSON, whether or not it named a workflow.
+    """
     request = AgentTemplateRequest(
         agent_name="adw_classifier",
         slash_command="/classify_adw",
@@ -69,7 +89,7 @@ def extract_adw_info(text: str, temp_adw_id: str) -> ADWExtractionResult:
 
         if not response.success:
             print(f"Failed to classify ADW: {response.output}")
-            return ADWExtractionResult()
+            return ADWExtractionResult(), False
 
         try:
             data = parse_json(response.output, dict)
@@ -82,17 +102,39 @@ def extract_adw_info(text: str, temp_adw_id: str) -> ADWExtractionResult:
                     workflow_command=adw_command,
                     adw_id=adw_id,
                     model_set=model_set
-                )
+                ), True
 
-            return ADWExtractionResult()
+            return ADWExtractionResult(), True
 
         except ValueError as e:
             print(f"Failed to parse classify_adw response: {e}")
-            return ADWExtractionResult()
+            return ADWExtractionResult(), False
 
     except Exception as e:
         print(f"Error calling classify_adw: {e}")
-        return ADWExtractionResult()
+        return ADWExtractionResult(), False
+
+
+def extract_adw_info(text: str, temp_adw_id: str) -> ADWExtractionResult:
+    """Extract ADW workflow, ID, and model_set from text using classify_adw agent.
+
+    Successful classifications are kept in a small LRU cache keyed by a hash
+    of the text, so redelivered webhooks for the same content skip the agent.
+    """
+    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _adw_info_lock:
+        cached = _adw_info_cache.get(key)
+        if cached is not None:
+            _adw_info_cache.move_to_end(key)
+            return cached
+
+    result, cacheable = _classify_adw(text, temp_adw_id)
+    if cacheable:
+        with _adw_info_lock:
+            _adw_info_cache[key] = result
+            if len(_adw_info_cache) > ADW_INFO_CACHE_SIZE:
+                _adw_info_cache.popitem(last=False)
+    return result
 
 
 def classify_issue(
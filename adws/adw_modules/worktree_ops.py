@@ -1,6 +1,11 @@
-"""Worktree operations for ADW isolated workflows."""
+"""Worktree operations for ADW isolated workflows.
 
+Git output is captured as raw bytes and only decoded when it is reported.
+"""
+
+import functools
 import os
+import shutil
 import subprocess
 import sys
 import logging
@@ -8,8 +13,9 @@ from typing import Tuple, Optional
 import socket
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> str:
-    """Get the project root directory."""
+    """Get the project root directory (computed once per process)."""
     script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     return script_dir
 
@@ -39,20 +45,7 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
         else:
             # If invalid, remove it and create a new one
             logger.warning(f"Existing worktree is invalid: {error}. Removing and recreating...")
-            try:
-                result = subprocess.run(
-                    ["git", "worktree", "remove", worktree_path, "--force"],
-                    capture_output=True,
-                    text=True,
-                    cwd=project_root,
-                )
-                if result.returncode != 0:
-                    # Try manual removal
-                    import shutil
-                    shutil.rmtree(worktree_path)
-            except Exception as e:
-                logger.warning(f"Error removing invalid worktree: {e}")
-                # Continue to try creating new one
+            remove_invalid_worktree(worktree_path, error, logger)
     
     # Ensure trees directory exists
     trees_dir = os.path.join(project_root, "trees")
@@ -63,7 +56,6 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
         result = subprocess.run(
             ["git", "branch", "--list", branch_name],
             capture_output=True,
-            text=True,
             cwd=project_root,
         )
         branch_exists = bool(result.stdout.strip())
@@ -74,7 +66,6 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
             result = subprocess.run(
                 ["git", "worktree", "add", worktree_path, branch_name],
                 capture_output=True,
-                text=True,
                 cwd=project_root,
             )
         else:
@@ -83,12 +74,11 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
             result = subprocess.run(
                 ["git", "worktree", "add", "-b", branch_name, worktree_path],
                 capture_output=True,
-                text=True,
                 cwd=project_root,
             )
         
         if result.returncode != 0:
-            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            error_msg = result.stderr.decode("utf-8", "replace").strip() if result.stderr else "Unknown error"
             logger.error(f"Failed to create worktree: {error_msg}")
             return None, error_msg
         
@@ -101,6 +91,53 @@ def create_worktree(adw_id: str, branch_name: str, logger: logging.Logger) -> Tu
         return None, error_msg
 
 
+def remove_invalid_worktree(worktree_path: str, error: Optional[str], logger: logging.Logger) -> None:
+    """Remove a worktree directory that failed validation.
+    
+    When the directory is not a git repository (or is already gone), git has
+    nothing to remove, so the directory is deleted directly, its registry
+    entry is unlocked (prune skips locked entries) and the registry is
+    pruned. Only a registered-but-broken worktree goes through
+    `git worktree remove --force --force` (forced twice so a worktree that
+    was locked by hand is removed as well).
+    
+    Args:
+        worktree_path: Path to the invalid worktree directory
+        error: Error message returned by validate_worktree_path
+        logger: Logger instance
+    """
+    project_root = get_project_root()
+    error = error or ""
+    
+    try:
+        if "not a git repository" in error or "does not exist" in error:
+            shutil.rmtree(worktree_path, ignore_errors=True)
+            # Fails harmlessly if the path is not registered or not locked
+            subprocess.run(
+                ["git", "worktree", "unlock", worktree_path],
+                capture_output=True,
+                cwd=project_root,
+            )
+            subprocess.run(
+                ["git", "worktree", "prune"],
+                capture_output=True,
+                cwd=project_root,
+            )
+            return
+        
+        result = subprocess.run(
+            ["git", "worktree", "remove", worktree_path, "--force", "--force"],
+            capture_output=True,
+            cwd=project_root,
+        )
+        if result.returncode != 0:
+            # Try manual removal
+            shutil.rmtree(worktree_path)
+    except Exception as e:
+        logger.warning(f"Error removing invalid worktree: {e}")
+        # Continue to try creating new one
+
+
 def validate_worktree_path(worktree_path: str, logger: logging.Logger) -> Tuple[bool, Optional[str]]:
     """Validate that a worktree path is a valid git worktree.
     
@@ -128,14 +165,13 @@ def validate_worktree_path(worktree_path: str, logger: logging.Logger) -> Tuple[
         result = subprocess.run(
             ["git", "worktree", "list"],
             capture_output=True,
-            text=True,
             cwd=get_project_root(),
         )
         if result.returncode != 0:
             return False, "Failed to list worktrees"
         
         # Check if our path is in the list
-        if worktree_path not in result.stdout:
+        if os.fsencode(worktree_path) not in result.stdout:
             return False, f"Worktree not registered in git: {worktree_path}"
         
         return True, None
@@ -180,6 +216,14 @@ def setup_worktree_environment(worktree_path: str, backend_port: int, logger: lo
     logger.debug(f"Port allocated: Backend={backend_port}")
 
 
+def _fnv1a(data: bytes) -> int:
+    """Compute the 64-bit FNV-1a hash of data (stable across processes)."""
+    h = 0xcbf29ce484222325
+    for b in data:
+        h = ((h ^ b) * 0x100000001b3) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
 def get_ports_for_adw(adw_id: str) -> Tuple[int, Optional[int]]:
     """Deterministically assign ports based on ADW ID.
     
@@ -190,7 +234,8 @@ def get_ports_for_adw(adw_id: str) -> Tuple[int, Optional[int]]:
         id_chars = ''.join(c for c in adw_id[:8] if c.isalnum())
         index = int(id_chars, 36) % 15
     except ValueError:
-        index = hash(adw_id) % 15
+        # Built-in hash() is salted per process, so use a stable hash instead
+        index = _fnv1a(adw_id.encode()) % 15
     
     backend_port = 9100 + index
     return backend_port, None
@@ -26,54 +26,18 @@ Key features:
 - Enables parallel execution of multiple patches
 """
 
+from __future__ import annotations
+
 import sys
 import os
 import logging
 import json
-import subprocess
-from typing import Optional
-from dotenv import load_dotenv
-
-from adw_modules.state import ADWState
-from adw_modules.git_ops import commit_changes, finalize_git_operations
-from adw_modules.github import (
-    fetch_issue,
-    make_issue_comment,
-    get_repo_url,
-    extract_repo_path,
-    find_keyword_from_comment,
-)
-from adw_modules.workflow_ops import (
-    create_commit,
-    format_issue_message,
-    ensure_adw_id,
-    implement_plan,
-    create_and_implement_patch,
-    AGENT_IMPLEMENTOR,
-)
-from adw_modules.worktree_ops import (
-    create_worktree,
-    validate_worktree,
-    get_ports_for_adw,
-    is_port_available,
-    find_next_available_ports,
-    setup_worktree_environment,
-)
-from adw_modules.utils import setup_logger
-from adw_modules.data_types import (
-    GitHubIssue,
-    AgentTemplateRequest,
-    AgentPromptResponse,
-)
-from adw_modules.agent import execute_template
-from adw_modules.error_handling import (
-    handle_error,
-    safe_execute,
-    validate_tuple_result,
-    ADWError,
-    ErrorSeverity,
-)
-from adw_modules.preflight import run_preflight_checks
+from typing import TYPE_CHECKING
+
+# adw_modules imports are deferred to the functions that use them so that
+# argument errors do not pay for loading the full workflow stack.
+if TYPE_CHECKING:
+    from adw_modules.data_types import GitHubIssue
 
 # Agent name constants
 AGENT_PATCH_PLANNER = "patch_planner"
@@ -95,8 +59,12 @@ def get_patch_content(
         The patch content to use for creating the patch plan
 
     Raises:
-        SystemExit: If 'adw_patch' keyword is not found
+        ADWError: If 'adw_patch' keyword is not found
     """
+    from adw_modules.github import find_keyword_from_comment, make_issue_comment
+    from adw_modules.workflow_ops import format_issue_message
+    from adw_modules.error_handling import ADWError
+
     # First, check for the latest comment containing 'adw_patch'
     keyword_comment = find_keyword_from_comment("adw_patch", issue)
 
@@ -140,14 +108,45 @@ def get_patch_content(
 
 def main():
     """Main entry point."""
-    # Load environment variables
-    load_dotenv()
-
     # Parse command line args
     if len(sys.argv) < 2:
         print("Usage: uv run adws/adw_patch_iso.py <issue-number> [adw-id]")
         sys.exit(1)
 
+    from dotenv import load_dotenv
+    from adw_modules.state import ADWState
+    from adw_modules.git_ops import commit_changes, finalize_git_operations
+    from adw_modules.github import (
+        fetch_issue,
+        make_issue_comment,
+        get_repo_url,
+        extract_repo_path,
+    )
+    from adw_modules.workflow_ops import (
+        create_commit,
+        format_issue_message,
+        ensure_adw_id,
+        create_and_implement_patch,
+    )
+    from adw_modules.worktree_ops import (
+        create_worktree,
+        get_ports_for_adw,
+        is_port_available,
+        find_next_available_ports,
+        setup_worktree_environment,
+    )
+    from adw_modules.utils import setup_logger
+    from adw_modules.error_handling import (
+        handle_error,
+        safe_execute,
+        validate_tuple_result,
+        ADWError,
+    )
+    from adw_modules.preflight import run_preflight_checks
+
+    # Load environment variables
+    load_dotenv()
+
     issue_number = sys.argv[1]
     adw_id = sys.argv[2] if len(sys.argv) > 2 else None
 
@@ -427,10 +426,12 @@ def main():
 if __name__ == "__main__":
     try:
         main()
-    except ADWError as e:
-        # ADWError is already handled, just exit
-        sys.exit(e.exit_code)
     except Exception as e:
+        from adw_modules.error_handling import ADWError
+
+        if isinstance(e, ADWError):
+            # ADWError is already handled, just exit
+            sys.exit(e.exit_code)
         # Unexpected error - log and exit
         print(f"Unexpected error: {e}", file=sys.stderr)
         import traceback
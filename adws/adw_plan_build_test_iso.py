@@ -3,18 +3,22 @@
 ADW Plan Build Test Iso - Combined workflow for planning, building, and testing
 
 Usage:
-  uv run adws/adw_plan_build_test_iso.py <issue-number> [adw-id]
-  # or: python3 adws/adw_plan_build_test_iso.py <issue-number> [adw-id]  # with venv activated
+  uv run adws/adw_plan_build_test_iso.py <issue-number> [adw-id] [--pipeline]
+  # or: python3 adws/adw_plan_build_test_iso.py <issue-number> [adw-id] [--pipeline]  # with venv activated
 
 This script orchestrates:
 1. Planning (adw_plan_iso.py)
 2. Building (adw_build_iso.py)
 3. Testing (adw_test_iso.py)
+
+With --pipeline, the test pre-flight checks run in a background thread while
+the build step is running, and the test step skips re-running them.
 """
 
 import sys
 import subprocess
 import os
+import threading
 from dotenv import load_dotenv
 
 # Get the directory where this script is located
@@ -25,12 +29,15 @@ def main():
     """Main entry point."""
     load_dotenv()
 
-    if len(sys.argv) < 2:
-        print("Usage: uv run adws/adw_plan_build_test_iso.py <issue-number> [adw-id]")
+    pipeline = "--pipeline" in sys.argv
+    args = [arg for arg in sys.argv if arg != "--pipeline"]
+
+    if len(args) < 2:
+        print("Usage: uv run adws/adw_plan_build_test_iso.py <issue-number> [adw-id] [--pipeline]")
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    issue_number = args[1]
+    adw_id = args[2] if len(args) > 2 else None
 
     # Step 1: Plan
     print("\n" + "="*60)
@@ -87,17 +94,36 @@ def main():
     print("STEP 2: Building")
     print("="*60 + "\n")
     build_cmd = [sys.executable, os.path.join(SCRIPT_DIR, "adw_build_iso.py"), issue_number, adw_id]
+
+    # Overlap the test pre-flight checks with the build step
+    preflight_result = {}
+    preflight_thread = None
+    if pipeline:
+        from adw_test_iso import preflight_only
+
+        def test_preflight():
+            preflight_result["passed"] = preflight_only(issue_number, adw_id)
+
+        preflight_thread = threading.Thread(target=test_preflight, daemon=True)
+        preflight_thread.start()
     
     result = subprocess.run(build_cmd)
+    if preflight_thread:
+        preflight_thread.join()
     if result.returncode != 0:
         print(f"\n❌ Building failed with exit code {result.returncode}")
         sys.exit(1)
+    if pipeline and not preflight_result.get("passed"):
+        print("\n❌ Test pre-flight checks failed, skipping test step")
+        sys.exit(1)
 
     # Step 3: Test
     print("\n" + "="*60)
     print("STEP 3: Testing")
     print("="*60 + "\n")
     test_cmd = [sys.executable, os.path.join(SCRIPT_DIR, "adw_test_iso.py"), issue_number, adw_id]
+    if pipeline:
+        test_cmd.append("--skip-preflight")
     
     result = subprocess.run(test_cmd)
     if result.returncode != 0:
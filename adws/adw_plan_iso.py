@@ -18,6 +18,7 @@ Workflow:
 9. Push and create/update PR
 """
 
+import asyncio
 import sys
 import os
 import logging
@@ -29,10 +30,10 @@ from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations
 from adw_modules.github import (
     fetch_issue,
-    make_issue_comment,
     get_repo_url,
     extract_repo_path,
 )
+from adw_modules.github_comment_queue import enqueue_comment, flush_comments
 from adw_modules.workflow_ops import (
     classify_issue,
     build_plan,
@@ -62,8 +63,12 @@ from adw_modules.error_handling import (
 from adw_modules.preflight import run_preflight_checks
 
 
-def main():
-    """Main entry point."""
+async def main():
+    """Main entry point.
+
+    Independent blocking calls (GitHub lookups, port scanning, issue comments)
+    are run in worker threads and awaited together to overlap their latency.
+    """
     load_dotenv()
 
     if len(sys.argv) < 2:
@@ -97,15 +102,19 @@ def main():
     except ADWError as e:
         handle_error(e, logger, issue_number, adw_id, "ops", "Pre-flight validation")
 
-    # Get repository URL and path
-    github_repo_url = safe_execute(
-        lambda: get_repo_url(),
-        logger,
-        "Failed to get repository URL",
-        issue_number,
-        adw_id,
-        "ops",
-        "Getting repository URL",
+    # Repository lookup and port allocation are independent, so overlap them
+    github_repo_url, (backend_port, _) = await asyncio.gather(
+        asyncio.to_thread(
+            safe_execute,
+            get_repo_url,
+            logger,
+            "Failed to get repository URL",
+            issue_number,
+            adw_id,
+            "ops",
+            "Getting repository URL",
+        ),
+        asyncio.to_thread(find_next_available_ports, adw_id),
     )
     
     repo_path = safe_execute(
@@ -119,7 +128,8 @@ def main():
     )
 
     # Fetch issue
-    issue = safe_execute(
+    issue = await asyncio.to_thread(
+        safe_execute,
         lambda: fetch_issue(issue_number, repo_path),
         logger,
         "Failed to fetch GitHub issue",
@@ -129,24 +139,25 @@ def main():
         "Fetching issue",
     )
 
-    make_issue_comment(
+    state.update(issue_number=issue_number)
+    state.save("adw_plan_iso")
+
+    # Posted in the background while the issue is being classified
+    enqueue_comment(
         issue_number,
         format_issue_message(adw_id, "ops", "🚀 Starting ADW planning workflow...")
     )
 
-    state.update(issue_number=issue_number)
-    state.save("adw_plan_iso")
-
     # Classify issue
     issue_command = validate_tuple_result(
         classify_issue(issue, adw_id, logger),
         "Failed to classify issue",
         logger,
-            issue_number,
+        issue_number,
         adw_id,
         "ops",
         "Classifying issue",
-        )
+    )
 
     state.update(issue_class=issue_command)
     logger.info(f"Issue classified as: {issue_command}")
@@ -163,8 +174,6 @@ def main():
     )
 
     state.update(branch_name=branch_name)
-
-    backend_port, _ = find_next_available_ports(adw_id)
     state.update(backend_port=backend_port)
 
     # Create worktree
@@ -219,9 +228,11 @@ def main():
         if not success:
             logger.warning(f"Failed to commit: {error}")
 
+    # Keep queued comments ahead of the PR comment posted by finalize
+    flush_comments()
     finalize_git_operations(state, logger, cwd=worktree_path)
 
-    make_issue_comment(
+    enqueue_comment(
         issue_number,
         format_issue_message(adw_id, AGENT_PLANNER, f"✅ Planning complete! Plan file: {plan_file}")
     )
@@ -231,7 +242,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except ADWError as e:
         # ADWError is already handled, just exit
         sys.exit(e.exit_code)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+ADW Runner - Run several ADW workflows for one issue in a single interpreter
+
+Usage:
+  uv run adws/adw_runner.py --issue <issue-number> --workflow <name>[:<adw-id>] [--workflow ...]
+
+Each workflow script is executed in turn as __main__ with the same argv it
+would get on the command line (<issue-number> [adw-id]). Modules imported by
+the first workflow (adw_modules, dotenv, rococo, ...) stay loaded for the
+rest, so only the first pays interpreter and import startup. A workflow that
+exits with an error does not stop the ones after it.
+
+Used by adw_triggers/trigger_webhook.py to batch workflows triggered for the
+same issue in quick succession. The webhook calls main() in process pool
+workers set up by init_pool_worker(), which preloads the shared modules
+before any workflow is assigned.
+"""
+
+import argparse
+import importlib
+import os
+import runpy
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ADWS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules imported by the workflow scripts, loaded ahead of time by pool workers
+PRELOAD_MODULES = [
+    "dotenv",
+    "adw_modules.data_types",
+    "adw_modules.utils",
+    "adw_modules.state",
+    "adw_modules.github",
+    "adw_modules.github_comment_queue",
+    "adw_modules.agent",
+    "adw_modules.git_ops",
+    "adw_modules.workflow_ops",
+    "adw_modules.worktree_ops",
+    "adw_modules.error_handling",
+    "adw_modules.preflight",
+]
+
+
+def init_pool_worker(env: Dict[str, str]) -> None:
+    """Prepare a process pool worker to run workflows via main().
+
+    Gives the worker the same environment a workflow subprocess would get:
+    only the given (filtered) environment variables, the adws directory as
+    working directory, and output discarded since workflows write their own
+    logs. Then imports PRELOAD_MODULES so the first workflow starts warm.
+
+    Args:
+        env: Environment variables for workflows (see get_safe_subprocess_env)
+    """
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(ADWS_DIR)
+    if ADWS_DIR not in sys.path:
+        sys.path.insert(0, ADWS_DIR)
+
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def parse_workflow_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """Split a '<name>[:<adw-id>]' spec into (name, adw_id)."""
+    name, _, adw_id = spec.partition(":")
+    return name, adw_id or None
+
+
+def run_workflow(issue_number: str, workflow: str, adw_id: Optional[str]) -> int:
+    """Run one workflow script in this interpreter and return its exit code."""
+    script_path = os.path.join(ADWS_DIR, f"adw_{workflow.replace('adw_', '')}.py")
+    if not os.path.exists(script_path):
+        print(f"ERROR: Workflow script not found: {script_path}")
+        return 1
+
+    argv = [script_path, issue_number]
+    if adw_id:
+        argv.append(adw_id)
+
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"ERROR: Workflow {workflow} failed: {e}")
+        return 1
+    finally:
+        sys.argv = saved_argv
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run several ADW workflows for one issue in a single interpreter",
+    )
+    parser.add_argument("--issue", required=True, help="GitHub issue number")
+    parser.add_argument(
+        "--workflow",
+        action="append",
+        required=True,
+        metavar="NAME[:ADW_ID]",
+        help="Workflow to run, optionally with an existing ADW ID (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    for spec in args.workflow:
+        workflow, adw_id = parse_workflow_spec(spec)
+        print(f"INFO: Running {workflow} for issue #{args.issue}")
+        code = run_workflow(args.issue, workflow, adw_id)
+        if code != 0:
+            print(f"ERROR: {workflow} exited with code {code}")
+            exit_code = exit_code or code
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,17 @@
 ADW Test Iso - AI Developer Workflow for agentic testing in isolated worktrees
 
 Usage:
-  uv run adws/adw_test_iso.py <issue-number> <adw-id> [--skip-e2e]
-  # or: python3 adws/adw_test_iso.py <issue-number> <adw-id> [--skip-e2e]  # with venv activated
+  uv run adws/adw_test_iso.py <issue-number> <adw-id> [--skip-e2e] [--skip-preflight]
+  # or: python3 adws/adw_test_iso.py <issue-number> <adw-id> [--skip-e2e] [--skip-preflight]  # with venv activated
+
+  --skip-preflight skips the pre-flight checks; used by adw_plan_build_test_iso.py
+  --pipeline, which already ran them (see preflight_only) while the build step ran.
 
 Workflow:
 1. Load state and validate worktree exists
-2. Run pytest test suite in worktree
-3. Generate tests for uncovered code (using SonarQube coverage if available)
-4. Auto-resolve test failures
+2. Generate tests for uncovered code (using SonarQube coverage if available)
+3. Auto-resolve test failures
+4. Run pytest test suite in worktree
 5. Report results to issue
 6. Commit test results in worktree
 7. Push and update PR
@@ -27,12 +30,19 @@ For a complete workflow that handles dependencies automatically:
 This will run planning, building, and testing in sequence.
 """
 
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
 import json
+import re
 import subprocess
 import sys
 import os
 import logging
-from typing import Tuple, Optional, List
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Tuple, Optional, List
 from dotenv import load_dotenv
 from adw_modules.data_types import (
     AgentTemplateRequest,
@@ -43,9 +53,9 @@ from adw_modules.agent import execute_template
 from adw_modules.github import (
     extract_repo_path,
     fetch_issue,
-    make_issue_comment,
     get_repo_url,
 )
+from adw_modules.github_comment_queue import enqueue_comment, flush_comments
 from adw_modules.utils import setup_logger, parse_json
 from adw_modules.state import ADWState
 from adw_modules.git_ops import commit_changes, finalize_git_operations
@@ -54,7 +64,6 @@ from adw_modules.workflow_ops import (
     create_commit,
 )
 from adw_modules.worktree_ops import validate_worktree
-from adw_modules.sonarqube import SonarQubeClient
 from adw_modules.error_handling import (
     handle_error,
     safe_execute,
@@ -64,9 +73,72 @@ from adw_modules.error_handling import (
 )
 from adw_modules.preflight import run_preflight_checks
 
+if TYPE_CHECKING:
+    from adw_modules.sonarqube import SonarQubeClient
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 AGENT_TESTER = "test_runner"
 MAX_TEST_RETRY_ATTEMPTS = 4
 MAX_TEST_GENERATION_ITERATIONS = 1  # Limit iterations to prevent infinite loops
+TEST_PREFLIGHT_CHECKS = ["env_vars", "git_repo", "git_remote"]
+COVERAGE_PATH_PREFIXES = ("flask/", "common/")  # Source trees that get generated tests
+PYTEST_OUTPUT_TAIL_LINES = 200  # Lines of pytest output retained for parsing
+# Run pytest inside this interpreter instead of a fresh one (opt-in; the
+# worktree must use the same environment as the ADW scripts)
+PYTEST_IN_PROCESS = os.getenv("ADW_PYTEST_IN_PROCESS", "").lower() in ("1", "true")
+PYTEST_ARGS = ["tests/", "-v", "--tb=short"]
+RESOLVE_ERROR_MAX_CHARS = 1024  # Per-test error text sent to /resolve_failed_test
+
+_JSON_INDENT_ENCODER = json.JSONEncoder(indent=2)
+
+
+def dumps_indented(obj) -> str:
+    """Serialize obj as JSON indented by 2 spaces, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return _JSON_INDENT_ENCODER.encode(obj)
+
+# Precompiled patterns for parsing agent and pytest output
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*\n(\[.*?\])\n```', re.DOTALL)
+# A test results array is either empty or a list of objects
+_JSON_ARRAY_START_RE = re.compile(r'\[\s*[{\]]')
+_PYTEST_PASSED_RE = re.compile(r'(\d+)\s+passed')
+_PYTEST_FAILED_RE = re.compile(r'(\d+)\s+failed')
+
+
+def get_filtered_coverage_data(sonar_client: SonarQubeClient) -> Optional[Tuple[str, int]]:
+    """Fetch SonarQube coverage data limited to flask/ and common/.
+    
+    The filtered data is serialized once, so every test generation and retry
+    iteration passes the same string to the agent.
+    
+    Args:
+        sonar_client: Client for the project whose coverage is fetched
+    
+    Returns:
+        Tuple of (coverage JSON string, number of uncovered files kept), or
+        None if SonarQube returned no coverage data
+    """
+    coverage_dict = sonar_client.get_uncovered_files_dict(
+        path_prefixes=COVERAGE_PATH_PREFIXES
+    )
+    if not coverage_dict:
+        return None
+    
+    # ONLY include flask/ and common/ directories, exclude everything else
+    # (the server-side listing already does this; kept as a safety net)
+    # An empty file list prevents the agent from scanning the whole codebase
+    filtered_files = [
+        f for f in coverage_dict.get('files', [])
+        if f['path'].startswith(COVERAGE_PATH_PREFIXES)
+    ]
+    coverage_dict['files'] = filtered_files
+    coverage_dict['total_uncovered_files'] = len(filtered_files)
+    return dumps_indented(coverage_dict), len(filtered_files)
 
 
 def run_tests(
@@ -108,21 +180,70 @@ def run_tests(
     return test_response
 
 
+def _run_pytest_in_process(working_dir: str) -> Tuple[bool, str, str]:
+    """Run pytest with pytest.main() in this interpreter.
+    
+    Temporarily changes the working directory. Modules imported and sys.path
+    entries added by the run are rolled back afterwards so a later run picks
+    up test and source changes made in the worktree.
+    """
+    import pytest
+
+    saved_modules = set(sys.modules)
+    saved_path = list(sys.path)
+    saved_cwd = os.getcwd()
+    buffer = io.StringIO()
+    try:
+        os.chdir(working_dir)
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            exit_code = pytest.main(PYTEST_ARGS)
+    finally:
+        os.chdir(saved_cwd)
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - saved_modules:
+            del sys.modules[name]
+
+    tail = buffer.getvalue().splitlines(keepends=True)[-PYTEST_OUTPUT_TAIL_LINES:]
+    return exit_code == 0, "".join(tail), ""
+
+
 def run_pytest(working_dir: str, logger: logging.Logger) -> Tuple[bool, str, str]:
-    """Run pytest and return (success, stdout, stderr).
+    """Run pytest and return (success, output_tail, stderr).
     
     Uses sys.executable -m pytest to ensure pytest runs with the same Python
-    interpreter that's running this script, avoiding PATH issues.
+    interpreter that's running this script, avoiding PATH issues. With
+    ADW_PYTEST_IN_PROCESS set, pytest.main() is called in this interpreter
+    instead, skipping interpreter startup and plugin discovery.
+    
+    Output is streamed line by line (stderr merged into stdout) and only the
+    last PYTEST_OUTPUT_TAIL_LINES lines are kept, which includes the summary
+    used for counting results.
     """
+    if PYTEST_IN_PROCESS:
+        try:
+            return _run_pytest_in_process(working_dir)
+        except ImportError:
+            logger.warning("pytest is not importable in this interpreter, running it as a subprocess")
+        except Exception as e:
+            logger.error(f"Error running pytest: {e}")
+            return False, "", str(e)
+
     try:
         # Use sys.executable -m pytest for reliability
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
-            capture_output=True,
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "pytest", *PYTEST_ARGS],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            bufsize=1,
             cwd=working_dir,
         )
-        return result.returncode == 0, result.stdout, result.stderr
+        tail = deque(maxlen=PYTEST_OUTPUT_TAIL_LINES)
+        for line in proc.stdout:
+            logger.debug(line.rstrip())
+            tail.append(line)
+        proc.wait()
+        return proc.returncode == 0, "".join(tail), ""
     except Exception as e:
         logger.error(f"Error running pytest: {e}")
         return False, "", str(e)
@@ -136,31 +257,27 @@ def parse_test_results(
     Handles cases where the output may contain markdown text before/after the JSON.
     """
     try:
-        import re
         json_str = None
         
         # Strategy 1: Try to find JSON array in markdown code blocks (with flexible whitespace)
-        json_match = re.search(r'```(?:json)?\s*\n(\[.*?\])\n```', output, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(output)
         if json_match:
             json_str = json_match.group(1)
         else:
-            # Strategy 2: Find the first [ and its matching ] bracket
-            # Look for the first [ and matching ]
-            bracket_start = output.find('[')
-            if bracket_start != -1:
-                # Find the matching closing bracket
-                bracket_count = 0
-                bracket_end = bracket_start
-                for i in range(bracket_start, len(output)):
-                    if output[i] == '[':
-                        bracket_count += 1
-                    elif output[i] == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            bracket_end = i
-                            break
-                if bracket_end > bracket_start:
-                    json_str = output[bracket_start:bracket_end + 1]
+            # Strategy 2: Decode the first well-formed JSON array starting at a '['
+            # raw_decode reports where the array ends, which also handles
+            # brackets inside string values. Only brackets that open an object
+            # list are tried, so markdown links and prose are skipped in C.
+            decoder = json.JSONDecoder()
+            for match in _JSON_ARRAY_START_RE.finditer(output):
+                bracket_start = match.start()
+                try:
+                    obj, bracket_end = decoder.raw_decode(output, bracket_start)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(obj, list):
+                    json_str = output[bracket_start:bracket_end]
+                    break
         
         # Strategy 3: If still no JSON found, try parse_json which has its own extraction logic
         if not json_str:
@@ -226,7 +343,7 @@ def format_test_results_comment(
             comment_parts.append(f"### {test.test_name}")
             comment_parts.append("")
             comment_parts.append("```json")
-            comment_parts.append(json.dumps(test.as_dict(), indent=2))
+            comment_parts.append(dumps_indented(test.as_dict()))
             comment_parts.append("```")
             comment_parts.append("")
 
@@ -244,6 +361,11 @@ def format_test_results_comment(
     return "\n".join(comment_parts)
 
 
+def failure_signature(failed_tests: List[TestResult]) -> frozenset:
+    """Identify a set of failures by test name and (truncated) error message."""
+    return frozenset((test.test_name, (test.error or "")[:256]) for test in failed_tests)
+
+
 def resolve_failed_tests(
     failed_tests: List[TestResult],
     adw_id: str,
@@ -254,7 +376,18 @@ def resolve_failed_tests(
     if not failed_tests:
         return AgentPromptResponse(output="No failed tests to resolve", success=True)
 
-    failed_test_info = json.dumps([test.as_dict() for test in failed_tests], indent=2)
+    # Only the fields the resolver needs, without indentation, to keep the prompt small
+    failed_test_info = json.dumps(
+        [
+            {
+                "test_name": test.test_name,
+                "execution_command": test.execution_command,
+                "error": (test.error or "")[:RESOLVE_ERROR_MAX_CHARS],
+            }
+            for test in failed_tests
+        ],
+        separators=(",", ":"),
+    )
 
     request = AgentTemplateRequest(
         agent_name=AGENT_TESTER,
@@ -271,19 +404,49 @@ def resolve_failed_tests(
     return response
 
 
+def preflight_only(issue_number: str, adw_id: str) -> bool:
+    """Run the test workflow's pre-flight checks without running any tests.
+    
+    Lets a compositional workflow validate the test prerequisites while an
+    earlier step is still running.
+    
+    Returns:
+        True if all checks passed, False otherwise
+    """
+    logger = setup_logger(adw_id, "adw_test_iso")
+    try:
+        return run_preflight_checks(
+            logger,
+            issue_number=issue_number,
+            adw_id=adw_id,
+            checks=TEST_PREFLIGHT_CHECKS,
+        )
+    except ADWError as e:
+        logger.error(f"Test pre-flight validation failed: {e.message}")
+        return False
+
+
 def main():
     """Main entry point."""
     load_dotenv()
 
-    skip_e2e = "--skip-e2e" in sys.argv
-    args = [arg for arg in sys.argv if arg != "--skip-e2e"]
-
-    if len(args) < 3:
-        print("Usage: python adw_test_iso.py <issue-number> <adw-id> [--skip-e2e]")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Generate, fix, and run tests for an issue in its isolated worktree",
+    )
+    parser.add_argument("issue_number", help="GitHub issue number")
+    parser.add_argument("adw_id", help="ADW ID of the workflow that created the worktree")
+    parser.add_argument("--skip-e2e", action="store_true", help="Skip E2E tests")
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help="Skip pre-flight checks that an earlier step already ran",
+    )
+    args = parser.parse_args()
 
-    issue_number = args[1]
-    adw_id = args[2]
+    skip_e2e = args.skip_e2e
+    skip_preflight = args.skip_preflight
+    issue_number = args.issue_number
+    adw_id = args.adw_id
 
     temp_logger = setup_logger(adw_id, "adw_test_iso")
     state = ADWState.load(adw_id, temp_logger)
@@ -313,15 +476,18 @@ def main():
     logger.info(f"ADW Test Iso starting - ID: {adw_id}, Issue: {issue_number}")
 
     # Run pre-flight validation checks
-    try:
-        run_preflight_checks(
-            logger,
-            issue_number=issue_number,
-            adw_id=adw_id,
-            checks=["env_vars", "git_repo", "git_remote"],
-        )
-    except ADWError as e:
-        handle_error(e, logger, issue_number, adw_id, "ops", "Pre-flight validation")
+    if skip_preflight:
+        logger.info("Skipping pre-flight checks (already run by the calling workflow)")
+    else:
+        try:
+            run_preflight_checks(
+                logger,
+                issue_number=issue_number,
+                adw_id=adw_id,
+                checks=TEST_PREFLIGHT_CHECKS,
+            )
+        except ADWError as e:
+            handle_error(e, logger, issue_number, adw_id, "ops", "Pre-flight validation")
 
     # Validate worktree
     valid, error = validate_worktree(adw_id, state)
@@ -357,7 +523,7 @@ def main():
         "Extracting repository path",
     )
 
-    make_issue_comment(
+    enqueue_comment(
         issue_number,
         format_issue_message(adw_id, AGENT_TESTER, "🧪 Starting test execution...")
     )
@@ -365,13 +531,15 @@ def main():
     # Fetch SonarQube coverage data FIRST - REQUIRED for test generation
     coverage_data = None
     try:
+        from adw_modules.sonarqube import SonarQubeClient
+
         sonar_client = SonarQubeClient()
         logger.info("Fetching SonarQube coverage data (REQUIRED for test generation)...")
-        coverage_summary = sonar_client.get_uncovered_files_summary()
-        if not coverage_summary:
+        coverage = get_filtered_coverage_data(sonar_client)
+        if not coverage:
             error_msg = "Could not fetch SonarQube coverage data. Test generation requires SonarQube coverage data."
             logger.error(error_msg)
-            make_issue_comment(
+            enqueue_comment(
                 issue_number,
                 format_issue_message(adw_id, AGENT_TESTER, f"❌ {error_msg}")
             )
@@ -382,27 +550,11 @@ def main():
                 agent_name=AGENT_TESTER,
             )
         
-        # ONLY include flask/ and common/ directories, exclude everything else
-        import json as json_lib
-        coverage_dict = json_lib.loads(coverage_summary)
-        filtered_files = [
-            f for f in coverage_dict.get('files', [])
-            if (f['path'].startswith('flask/') or f['path'].startswith('common/'))
-            and not f['path'].startswith('adws/')
-            and not f['path'].startswith('tests/')
-        ]
-        
-        if not filtered_files:
+        coverage_data, uncovered_file_count = coverage
+        if not uncovered_file_count:
             logger.warning("No uncovered files found in flask/ or common/ directories")
-            # Create empty coverage data structure to prevent codebase scanning
-            coverage_dict['files'] = []
-            coverage_dict['total_uncovered_files'] = 0
-            coverage_data = json_lib.dumps(coverage_dict, indent=2)
         else:
-            coverage_dict['files'] = filtered_files
-            coverage_dict['total_uncovered_files'] = len(filtered_files)
-            coverage_data = json_lib.dumps(coverage_dict, indent=2)
-            logger.info(f"Filtered to {len(filtered_files)} uncovered files in flask/ and common/ (excluded adws/ and tests/)")
+            logger.info(f"Filtered to {uncovered_file_count} uncovered files in flask/ and common/ (excluded adws/ and tests/)")
         
         # Log summary
         metrics = sonar_client.get_project_metrics()
@@ -416,7 +568,7 @@ def main():
     except Exception as e:
         error_msg = f"SonarQube integration not available: {e}. Test generation requires SonarQube coverage data."
         logger.error(error_msg)
-        make_issue_comment(
+        enqueue_comment(
             issue_number,
             format_issue_message(adw_id, AGENT_TESTER, f"❌ {error_msg}")
         )
@@ -431,7 +583,7 @@ def main():
     if not coverage_data:
         error_msg = "No coverage data available. Test generation requires SonarQube coverage data."
         logger.error(error_msg)
-        make_issue_comment(
+        enqueue_comment(
             issue_number,
             format_issue_message(adw_id, AGENT_TESTER, f"❌ {error_msg}")
         )
@@ -442,25 +594,10 @@ def main():
             agent_name=AGENT_TESTER,
         )
 
-    # Run pytest first to get baseline
-    logger.info("Running pytest test suite...")
-    pytest_success, pytest_stdout, pytest_stderr = run_pytest(worktree_path, logger)
-    
-    # Parse pytest output to get actual test count
-    pytest_test_count = 0
-    if pytest_stdout:
-        # Extract test count from pytest output (e.g., "8 passed" or "8 passed, 2 failed")
-        import re
-        match = re.search(r'(\d+)\s+passed', pytest_stdout)
-        if match:
-            pytest_test_count = int(match.group(1))
-        logger.info(f"Pytest found {pytest_test_count} passing tests")
-
     # Run ADW test command to generate tests for uncovered code
     # Limit iterations to prevent infinite loops when trying to reach 100% coverage
-    all_results = []
-    total_passed = 0
-    total_failed = 0
+    # Latest result per test name, so re-runs replace rather than duplicate results
+    all_results_by_name: Dict[str, TestResult] = {}
     test_generation_success = False
     
     for iteration in range(MAX_TEST_GENERATION_ITERATIONS):
@@ -470,7 +607,7 @@ def main():
         if not test_response.success:
             logger.error(f"Test generation failed: {test_response.output}")
             if iteration == 0:  # Only report failure on first iteration
-                make_issue_comment(
+                enqueue_comment(
                     issue_number,
                     format_issue_message(adw_id, AGENT_TESTER, f"❌ Test generation failed: {test_response.output[:500]}")
                 )
@@ -478,12 +615,11 @@ def main():
 
         test_generation_success = True
         results, passed_count, failed_count = parse_test_results(test_response.output, logger)
-        all_results.extend(results)
-        total_passed += passed_count
-        total_failed += failed_count
+        all_results_by_name.update((result.test_name, result) for result in results)
 
         if failed_count > 0:
             failed_tests = [test for test in results if not test.passed]
+            seen_failures = {failure_signature(failed_tests)}
             
             # Attempt to resolve failures
             for attempt in range(MAX_TEST_RETRY_ATTEMPTS):
@@ -495,14 +631,17 @@ def main():
                     test_response = run_tests(adw_id, logger, working_dir=worktree_path, coverage_data=coverage_data)
                     if test_response.success:
                         results, passed_count, failed_count = parse_test_results(test_response.output, logger)
-                        # Update accumulated counts
-                        all_results.extend(results)
-                        total_passed += passed_count
-                        total_failed += failed_count
+                        # Update accumulated results
+                        all_results_by_name.update((result.test_name, result) for result in results)
                         if failed_count == 0:
                             logger.info("All tests resolved successfully!")
                             break
                         failed_tests = [test for test in results if not test.passed]
+                        signature = failure_signature(failed_tests)
+                        if signature in seen_failures:
+                            logger.warning("Test failures unchanged by resolution attempt, stopping retries")
+                            break
+                        seen_failures.add(signature)
         
         # If no failures and we have results, we can stop
         if failed_count == 0 and len(results) > 0:
@@ -518,10 +657,9 @@ def main():
     final_passed = 0
     final_failed = 0
     if final_pytest_stdout:
-        import re
         # Match patterns like "150 passed" or "145 passed, 5 failed"
-        passed_match = re.search(r'(\d+)\s+passed', final_pytest_stdout)
-        failed_match = re.search(r'(\d+)\s+failed', final_pytest_stdout)
+        passed_match = _PYTEST_PASSED_RE.search(final_pytest_stdout)
+        failed_match = _PYTEST_FAILED_RE.search(final_pytest_stdout)
         if passed_match:
             final_passed = int(passed_match.group(1))
         if failed_match:
@@ -549,21 +687,22 @@ def main():
         final_test_count_for_commit = final_test_count
     else:
         # Fall back to command results if pytest parsing failed
-        results = all_results
-        passed_count = total_passed
-        failed_count = total_failed
+        results = list(all_results_by_name.values())
+        passed_count = sum(1 for result in results if result.passed)
+        failed_count = len(results) - passed_count
         comment = format_test_results_comment(results, passed_count, failed_count)
         # Store count for commit message
         final_test_count_for_commit = len(results)
     
     if not test_generation_success:
         # Exit early if test generation failed
+        flush_comments()
         finalize_git_operations(state, logger, cwd=worktree_path)
         logger.error("ADW Test Iso failed - test generation unsuccessful")
         sys.exit(1)
 
     # Format and post results
-    make_issue_comment(
+    enqueue_comment(
         issue_number,
         format_issue_message(adw_id, AGENT_TESTER, comment)
     )
@@ -577,9 +716,11 @@ def main():
     except Exception as e:
         logger.warning(f"Could not commit test results: {e}")
 
+    # Keep queued comments ahead of the PR comment posted by finalize
+    flush_comments()
     finalize_git_operations(state, logger, cwd=worktree_path)
 
-    make_issue_comment(
+    enqueue_comment(
         issue_number,
         format_issue_message(adw_id, AGENT_TESTER, "✅ Test execution complete!")
     )
@@ -13,10 +13,15 @@ Environment Requirements:
 - All workflow requirements (GITHUB_PAT, ANTHROPIC_API_KEY, etc.)
 """
 
+import asyncio
+import functools
+import multiprocessing
 import os
-import subprocess
+import re
 import sys
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 try:
@@ -27,6 +32,11 @@ except ImportError:
     print("Install with: pip install fastapi uvicorn")
     sys.exit(1)
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -34,6 +44,7 @@ from adw_modules.utils import make_adw_id, setup_logger, get_safe_subprocess_env
 from adw_modules.github import make_issue_comment, ADW_BOT_IDENTIFIER
 from adw_modules.workflow_ops import extract_adw_info, AVAILABLE_ADW_WORKFLOWS
 from adw_modules.state import ADWState
+import adw_runner
 
 load_dotenv()
 
@@ -47,13 +58,148 @@ DEPENDENT_WORKFLOWS = [
     "adw_ship_iso",
 ]
 
+ADWS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Workflow name -> script path, for the workflows whose script exists
+WORKFLOW_SCRIPTS = {
+    name: path
+    for name in AVAILABLE_ADW_WORKFLOWS
+    if os.path.exists(path := os.path.join(ADWS_DIR, f"adw_{name.replace('adw_', '')}.py"))
+}
+
 app = FastAPI(
     title="ADW Webhook Trigger", description="GitHub webhook endpoint for ADW"
 )
 
-print(f"Starting ADW Webhook Trigger on port {PORT}")
+# Upper bound on workflows running at once; further triggers wait
+MAX_CONCURRENT_WORKFLOWS = int(os.getenv("ADW_MAX_CONCURRENT", "8"))
+# Strong references to running launch tasks so they are not garbage collected
+_workflow_tasks: Set[asyncio.Task] = set()
+# Workflows triggered for the same issue within this window share one worker
+BATCH_WINDOW_SECONDS = 0.5
+# Issue number -> workflow specs ("<name>[:<adw-id>]") waiting for the batch window
+_pending_workflows: Dict[str, List[str]] = {}
+_workflow_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_workflow_pool() -> ProcessPoolExecutor:
+    """Return the worker pool that runs workflows, creating it on first use.
+
+    Workers preload the modules the workflow scripts import (see
+    adw_runner.init_pool_worker) and each runs one batch before being
+    replaced, so every batch starts in a fresh but already warm interpreter.
+    """
+    global _workflow_pool
+    if _workflow_pool is None:
+        _workflow_pool = ProcessPoolExecutor(
+            max_workers=MAX_CONCURRENT_WORKFLOWS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=adw_runner.init_pool_worker,
+            initargs=(get_safe_subprocess_env(),),
+            max_tasks_per_child=1,
+        )
+    return _workflow_pool
+
+
+def _reset_workflow_pool(pool: ProcessPoolExecutor) -> None:
+    """Discard a broken worker pool so the next get_workflow_pool() builds a new one."""
+    global _workflow_pool
+    if _workflow_pool is pool:
+        _workflow_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _flush_pending_workflows(issue_number: str) -> None:
+    """Wait for the batch window, then run the issue's pending workflows."""
+    await asyncio.sleep(BATCH_WINDOW_SECONDS)
+    specs = _pending_workflows.pop(issue_number, [])
+    if not specs:
+        return
+    argv = ["--issue", issue_number]
+    for spec in specs:
+        argv += ["--workflow", spec]
+    label = f"{', '.join(specs)} for issue #{issue_number}"
+    try:
+        loop = asyncio.get_running_loop()
+        pool = get_workflow_pool()
+        try:
+            future = loop.run_in_executor(pool, adw_runner.main, argv)
+        except BrokenProcessPool:
+            # A worker that died earlier (OOM, segfault, os._exit) breaks the
+            # whole pool; replace it and submit once more
+            _reset_workflow_pool(pool)
+            pool = get_workflow_pool()
+            future = loop.run_in_executor(pool, adw_runner.main, argv)
+        try:
+            returncode = await future
+        except BrokenProcessPool:
+            # This batch's own worker died; the batch may have partly run, so
+            # it is not retried, but later batches get a new pool
+            _reset_workflow_pool(pool)
+            raise
+        print(f"INFO: Workflow {label} exited with code {returncode}")
+    except Exception as e:
+        print(f"ERROR: Failed to run workflow {label}: {e}")
+
+
+def schedule_workflow(issue_number: str, workflow: str, adw_id: Optional[str]) -> None:
+    """Queue a workflow for an issue, batching it with others triggered soon after."""
+    spec = f"{workflow}:{adw_id}" if adw_id else workflow
+    pending = _pending_workflows.get(issue_number)
+    if pending is not None:
+        pending.append(spec)
+        return
+    _pending_workflows[issue_number] = [spec]
+    task = asyncio.create_task(_flush_pending_workflows(issue_number))
+    _workflow_tasks.add(task)
+    task.add_done_callback(_workflow_tasks.discard)
+
+
+# Keyword categories for infer_workflow_from_content, in priority order.
+# Keywords match anywhere in the text (substring, case-insensitive).
+_WORKFLOW_KEYWORDS = [
+    # Test-related keywords
+    (["test", "coverage", "generate test", "write test", "testing", "uncovered code", "100%", "test coverage", "coverage must reach"], "adw_plan_build_test_iso"),
+    # Documentation keywords
+    (["document", "documentation", "readme", "doc", "write docs"], "adw_plan_build_document_iso"),
+    # Review keywords
+    (["review", "code review", "audit", "inspect"], "adw_plan_build_test_review_iso"),
+    # Bug fix keywords
+    (["fix", "bug", "error", "issue", "broken", "not working"], "adw_plan_build_test_iso"),
+    # Feature keywords
+    (["feature", "add", "implement", "create", "new", "enhancement"], "adw_plan_build_test_iso"),
+    # Default: full SDLC for any actionable content
+    (["do", "make", "build", "generate", "write", "create", "implement"], "adw_plan_build_test_iso"),
+]
+
+# One compiled alternation per category, so each category is a single scan
+_WORKFLOW_PATTERNS = [
+    (re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE), workflow)
+    for keywords, workflow in _WORKFLOW_KEYWORDS
+]
+
+
+def _build_workflow_automaton():
+    """Build an Aho-Corasick automaton mapping each keyword to (priority, workflow).
+
+    A keyword listed in several categories keeps its highest priority (lowest
+    index), so one pass over the content finds the same winner as checking
+    the categories in order.
+    """
+    automaton = ahocorasick.Automaton()
+    for priority, (keywords, workflow) in enumerate(_WORKFLOW_KEYWORDS):
+        for keyword in keywords:
+            if automaton.get(keyword, None) is None:
+                automaton.add_word(keyword, (priority, workflow))
+    automaton.make_automaton()
+    return automaton
+
 
+# Used instead of _WORKFLOW_PATTERNS when pyahocorasick is installed
+_WORKFLOW_AUTOMATON = _build_workflow_automaton() if ahocorasick is not None else None
 
+
+@functools.lru_cache(maxsize=512)
 def infer_workflow_from_content(content: str) -> Optional[str]:
     """
     Intelligently infer which ADW workflow to run based on natural language content.
@@ -62,41 +208,62 @@ def infer_workflow_from_content(content: str) -> Optional[str]:
     if not content:
         return None
     
-    content_lower = content.lower()
-    
-    # Test-related keywords
-    test_keywords = ["test", "coverage", "generate test", "write test", "testing", "uncovered code", "100%", "test coverage", "coverage must reach"]
-    if any(keyword in content_lower for keyword in test_keywords):
-        return "adw_plan_build_test_iso"
-    
-    # Documentation keywords
-    doc_keywords = ["document", "documentation", "readme", "doc", "write docs"]
-    if any(keyword in content_lower for keyword in doc_keywords):
-        return "adw_plan_build_document_iso"
-    
-    # Review keywords
-    review_keywords = ["review", "code review", "audit", "inspect"]
-    if any(keyword in content_lower for keyword in review_keywords):
-        return "adw_plan_build_test_review_iso"
-    
-    # Bug fix keywords
-    bug_keywords = ["fix", "bug", "error", "issue", "broken", "not working"]
-    if any(keyword in content_lower for keyword in bug_keywords):
-        return "adw_plan_build_test_iso"
+    if _WORKFLOW_AUTOMATON is not None:
+        best = None
+        # Skip the lowercase copy when the body is already lowercase
+        text = content if content.islower() else content.lower()
+        for _, (priority, workflow) in _WORKFLOW_AUTOMATON.iter(text):
+            if best is None or priority < best[0]:
+                best = (priority, workflow)
+                if priority == 0:
+                    break
+        return best[1] if best else None
     
-    # Feature keywords
-    feature_keywords = ["feature", "add", "implement", "create", "new", "enhancement"]
-    if any(keyword in content_lower for keyword in feature_keywords):
-        return "adw_plan_build_test_iso"
-    
-    # Default: full SDLC for any actionable content
-    actionable_keywords = ["do", "make", "build", "generate", "write", "create", "implement"]
-    if any(keyword in content_lower for keyword in actionable_keywords):
-        return "adw_plan_build_test_iso"
+    for pattern, workflow in _WORKFLOW_PATTERNS:
+        if pattern.search(content):
+            return workflow
     
     return None
 
 
+async def classify_content(
+    content: str, source: str, default_workflow: Optional[str] = None
+) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
+    """Pick the workflow to run for issue or comment content.
+
+    Always attempts classification, even without explicit "adw_" commands,
+    then falls back to keyword inference and finally to default_workflow.
+
+    Args:
+        content: Issue or comment text to classify
+        source: Label used in the trigger reason (e.g. "New issue", "Comment")
+        default_workflow: Workflow to use when nothing else matches
+
+    Returns:
+        Tuple of (workflow, adw_id, model_set, trigger_reason)
+    """
+    temp_id = make_adw_id()
+    extraction_result = await asyncio.to_thread(extract_adw_info, content, temp_id)
+    if extraction_result.has_workflow:
+        workflow = extraction_result.workflow_command
+        return (
+            workflow,
+            extraction_result.adw_id,
+            extraction_result.model_set,
+            f"{source} classified as {workflow}",
+        )
+
+    # No explicit workflow found, use intelligent inference
+    inferred_workflow = infer_workflow_from_content(content)
+    if inferred_workflow:
+        return inferred_workflow, None, None, f"{source} inferred workflow: {inferred_workflow}"
+
+    if default_workflow:
+        return default_workflow, None, None, f"{source} with content, defaulting to {default_workflow}"
+
+    return None, None, None, ""
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -133,24 +300,10 @@ async def github_webhook(request: Request):
                 print(f"Ignoring ADW bot issue to prevent loop")
                 workflow = None
             elif content_to_check:
-                # Always attempt classification, even without explicit "adw_" commands
-                temp_id = make_adw_id()
-                extraction_result = extract_adw_info(content_to_check, temp_id)
-                if extraction_result.has_workflow:
-                    workflow = extraction_result.workflow_command
-                    provided_adw_id = extraction_result.adw_id
-                    model_set = extraction_result.model_set
-                    trigger_reason = f"New issue classified as {workflow}"
-                else:
-                    # No explicit workflow found, use intelligent inference
-                    inferred_workflow = infer_workflow_from_content(content_to_check)
-                    if inferred_workflow:
-                        workflow = inferred_workflow
-                        trigger_reason = f"New issue inferred workflow: {workflow}"
-                    elif issue_body or issue_title:
-                        # Default to full SDLC workflow for issues with content
-                        workflow = "adw_plan_build_test_iso"
-                        trigger_reason = f"New issue with content, defaulting to {workflow}"
+                # Default to full SDLC workflow for issues with content
+                workflow, provided_adw_id, model_set, trigger_reason = await classify_content(
+                    content_to_check, "New issue", default_workflow="adw_plan_build_test_iso"
+                )
 
         elif event_type == "issue_comment" and action == "created" and issue_number:
             comment = payload.get("comment", {})
@@ -163,20 +316,9 @@ async def github_webhook(request: Request):
                 print(f"Ignoring ADW bot comment to prevent loop")
                 workflow = None
             elif comment_body:
-                # Always attempt classification, even without explicit "adw_" commands
-                temp_id = make_adw_id()
-                extraction_result = extract_adw_info(comment_body, temp_id)
-                if extraction_result.has_workflow:
-                    workflow = extraction_result.workflow_command
-                    provided_adw_id = extraction_result.adw_id
-                    model_set = extraction_result.model_set
-                    trigger_reason = f"Comment classified as {workflow}"
-                else:
-                    # No explicit workflow found, use intelligent inference
-                    inferred_workflow = infer_workflow_from_content(comment_body)
-                    if inferred_workflow:
-                        workflow = inferred_workflow
-                        trigger_reason = f"Comment inferred workflow: {workflow}"
+                workflow, provided_adw_id, model_set, trigger_reason = await classify_content(
+                    comment_body, "Comment"
+                )
 
         if workflow in DEPENDENT_WORKFLOWS:
             if not provided_adw_id:
@@ -185,7 +327,8 @@ async def github_webhook(request: Request):
                 )
                 workflow = None
                 try:
-                    make_issue_comment(
+                    await asyncio.to_thread(
+                        make_issue_comment,
                         str(issue_number),
                         f"❌ Error: `{workflow}` is a dependent workflow that requires an existing ADW ID.\n\n"
                         f"To run this workflow, you must provide the ADW ID in your comment, for example:\n"
@@ -201,33 +344,21 @@ async def github_webhook(request: Request):
             if model_set:
                 state = ADWState(adw_id)
                 state.update(model_set=model_set)
-                state.save("webhook_trigger")
-
-            script_name = f"adw_{workflow.replace('adw_', '')}.py"
-            script_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), script_name
-            )
+                await asyncio.to_thread(state.save, "webhook_trigger")
 
-            if not os.path.exists(script_path):
-                print(f"ERROR: Workflow script not found: {script_path}")
+            if workflow not in WORKFLOW_SCRIPTS:
+                script_name = f"adw_{workflow.replace('adw_', '')}.py"
+                print(f"ERROR: Workflow script not found: {os.path.join(ADWS_DIR, script_name)}")
                 return {"status": "error", "message": f"Workflow script not found: {script_name}"}
 
-            cmd = [sys.executable, script_path, str(issue_number)]
-            if provided_adw_id:
-                cmd.append(provided_adw_id)
-
             print(f"INFO: Triggering {workflow} for issue #{issue_number} (ADW ID: {adw_id})")
 
-            subprocess.Popen(
-                cmd,
-                cwd=os.path.dirname(script_path),
-                env=get_safe_subprocess_env(),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+            # Launched in the background so the webhook responds immediately
+            schedule_workflow(str(issue_number), workflow, provided_adw_id)
 
             try:
-                make_issue_comment(
+                await asyncio.to_thread(
+                    make_issue_comment,
                     str(issue_number),
                     f"🚀 ADW workflow triggered: `{workflow}` (ADW ID: {adw_id})\n\n"
                     f"Reason: {trigger_reason}",
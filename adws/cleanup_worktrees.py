@@ -16,6 +16,8 @@ Options:
   --worktrees-only   Only clean worktrees (skip state files and artifacts)
   --states-only      Only clean state files and artifacts (skip worktrees)
   --keep-active      Skip ADW IDs that appear to be actively running
+  --jobs <N>         Stat and clean N ADW IDs in parallel (default: up to 16
+                     for stats, 32 for cleanup; 1 disables parallelism)
 """
 
 import sys
@@ -24,14 +26,66 @@ import subprocess
 import argparse
 import shutil
 import json
-from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Optional, Set
+
+# fd-relative unlink/rmdir is unavailable on some platforms (e.g. Windows)
+_HAVE_DIR_FD = (
+    {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+    and hasattr(os, "O_DIRECTORY")
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TREES_DIR = os.path.join(PROJECT_ROOT, "trees")
+AGENTS_DIR = os.path.join(PROJECT_ROOT, "agents")
+
+# os.stat() results by path (None if the path is missing), shared by the
+# planning and display steps so each worktree/state file is stat'ed once
+_stat_cache: Dict[str, Optional[os.stat_result]] = {}
 
 def get_project_root() -> str:
     """Get the project root directory."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.dirname(script_dir)
+    return PROJECT_ROOT
+
+
+def _list_worktrees(nul_terminated: bool) -> Optional[List[Tuple[str, str]]]:
+    """Run `git worktree list --porcelain` and collect worktrees under trees/.
+    
+    Args:
+        nul_terminated: Pass -z (git >= 2.36) so paths containing newlines
+            come through intact
+    
+    Returns:
+        List of (adw_id, worktree_path) tuples, or None if git failed
+    """
+    cmd = ["git", "worktree", "list", "--porcelain"]
+    separator = b'\n'
+    if nul_terminated:
+        cmd.append("-z")
+        separator = b'\0'
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    
+    # Porcelain output is one "key value" field per separator. Fields are
+    # parsed as git writes them rather than after buffering the whole listing.
+    worktrees = []
+    pending = b''
+    with proc:
+        for chunk in iter(lambda: proc.stdout.read1(65536), b''):
+            fields = (pending + chunk).split(separator)
+            pending = fields.pop()
+            for field in fields:
+                if field.startswith(b'worktree ') and b'/trees/' in field:
+                    worktree_path = os.fsdecode(field[len(b'worktree '):])
+                    # Extract ADW ID from path like trees/bd40afd4
+                    adw_id = os.path.basename(worktree_path)
+                    worktrees.append((adw_id, worktree_path))
+    
+    if proc.returncode != 0:
+        return None
+    
+    return worktrees
 
 
 def get_worktrees() -> List[Tuple[str, str]]:
@@ -41,23 +95,16 @@ def get_worktrees() -> List[Tuple[str, str]]:
         List of (adw_id, worktree_path) tuples
     """
     try:
-    result = subprocess.run(
-        ["git", "worktree", "list"],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        worktrees = _list_worktrees(nul_terminated=True)
+        if worktrees is None:
+            # git before 2.36 rejects -z
+            worktrees = _list_worktrees(nul_terminated=False)
+    except FileNotFoundError:
         return []
     
-    worktrees = []
-    for line in result.stdout.strip().split('\n'):
-        if 'trees/' in line:
-            parts = line.split()
-            worktree_path = parts[0]
-            # Extract ADW ID from path like trees/bd40afd4
-            adw_id = Path(worktree_path).name
-            worktrees.append((adw_id, worktree_path))
+    if worktrees is None:
+        print("Warning: 'git worktree list' failed; no worktrees will be cleaned", file=sys.stderr)
+        return []
     
     return worktrees
 
@@ -68,54 +115,79 @@ def get_state_files() -> List[Tuple[str, str]]:
     Returns:
         List of (adw_id, state_file_path) tuples
     """
-    project_root = get_project_root()
-    agents_dir = os.path.join(project_root, "agents")
-    
-    if not os.path.exists(agents_dir):
+    if not os.path.exists(AGENTS_DIR):
         return []
     
     state_files = []
-    for adw_id_dir in os.listdir(agents_dir):
-        adw_id_path = os.path.join(agents_dir, adw_id_dir)
-        if not os.path.isdir(adw_id_path):
-            continue
-        
-        state_file = os.path.join(adw_id_path, "adw_state.json")
-        if os.path.exists(state_file):
-            state_files.append((adw_id_dir, state_file))
+    with os.scandir(AGENTS_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            
+            state_file = os.path.join(entry.path, "adw_state.json")
+            if _stat(state_file) is not None:
+                state_files.append((entry.name, state_file))
     
     return state_files
 
 
-def get_agent_artifacts(adw_id: str) -> List[str]:
-    """Get list of agent artifact directories for an ADW ID.
+def _stat(path: str) -> Optional[os.stat_result]:
+    """Return the cached os.stat() result for path, or None if it does not exist."""
+    try:
+        return _stat_cache[path]
+    except KeyError:
+        pass
+    try:
+        st: Optional[os.stat_result] = os.stat(path)
+    except OSError:
+        st = None
+    _stat_cache[path] = st
+    return st
+
+
+def _prefetch_stats(paths: List[str], jobs: int) -> None:
+    """Fill the stat cache for paths using up to `jobs` threads.
     
-    Returns:
-        List of artifact directory paths
+    Paths already cached are skipped. On slow or networked filesystems this
+    overlaps the stat latency that the planning loops would otherwise pay
+    one path at a time.
     """
-    project_root = get_project_root()
-    agents_dir = os.path.join(project_root, "agents", adw_id)
-    
-    if not os.path.exists(agents_dir):
-        return []
+    missing = [path for path in paths if path not in _stat_cache]
+    if jobs <= 1 or len(missing) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(jobs, len(missing))) as executor:
+        # _stat stores each result in the cache; each path is set once
+        list(executor.map(_stat, missing))
+
+
+def is_valid_adw_id(adw_id: str) -> bool:
+    """Check that an ADW ID names an entry directly under trees/ and agents/.
     
-    artifacts = []
-    for item in os.listdir(agents_dir):
-        item_path = os.path.join(agents_dir, item)
-        # Skip state file and non-directories
-        if item == "adw_state.json" or not os.path.isdir(item_path):
-            continue
-        artifacts.append(item_path)
+    Rejects IDs containing path separators, "." and "..", and IDs whose
+    trees/ or agents/ path resolves (e.g. through a symlink) outside those
+    directories.
+    """
+    if adw_id in ("", ".", "..") or os.path.basename(adw_id) != adw_id:
+        return False
     
-    return artifacts
+    return all(
+        os.path.dirname(os.path.realpath(os.path.join(base_dir, adw_id))) == os.path.realpath(base_dir)
+        for base_dir in (TREES_DIR, AGENTS_DIR)
+    )
+
+
+def _get_file_mtime(file_path: str) -> Optional[float]:
+    """Get the modification time of a file/directory, or None if it does not exist."""
+    st = _stat(file_path)
+    return st.st_mtime if st is not None else None
 
 
 def get_file_age(file_path: str) -> int:
-    """Get age of file/directory in days."""
-    if not os.path.exists(file_path):
+    """Get age of file/directory in whole days."""
+    mtime = _get_file_mtime(file_path)
+    if mtime is None:
         return 0
     
-    mtime = os.path.getmtime(file_path)
     age_days = (datetime.now().timestamp() - mtime) / (24 * 60 * 60)
     return int(age_days)
 
@@ -134,27 +206,98 @@ def is_active_workflow(adw_id: str, max_age_hours: int = 24) -> bool:
     Returns:
         True if workflow appears active
     """
-    project_root = get_project_root()
-    
-    # Check state file
-    state_file = os.path.join(project_root, "agents", adw_id, "adw_state.json")
-    if os.path.exists(state_file):
-        age_hours = get_file_age(state_file) * 24
-        if age_hours < max_age_hours:
-            return True
-    
-    # Check worktree
-    worktree_path = os.path.join(project_root, "trees", adw_id)
-    if os.path.exists(worktree_path):
-        age_hours = get_file_age(worktree_path) * 24
-        if age_hours < max_age_hours:
+    # Compare exact mtimes; whole-day ages would round anything under a day
+    # down to 0h and anything under two days down to 24h. Paths are checked
+    # through the stat cache, state file first, stopping at the first recent one
+    active_since = datetime.now().timestamp() - max_age_hours * 60 * 60
+    for path in (
+        os.path.join(AGENTS_DIR, adw_id, "adw_state.json"),
+        os.path.join(TREES_DIR, adw_id),
+    ):
+        mtime = _get_file_mtime(path)
+        if mtime is not None and mtime > active_since:
             return True
     
     return False
 
 
+def _fast_rmtree(path: str) -> int:
+    """Remove a directory tree, unlinking entries relative to their parent's fd.
+    
+    Walks the tree iteratively with an explicit stack of open directories, so
+    each unlink/rmdir is a single lookup in an already open directory rather
+    than a walk of the full path. Symlinks are removed, never followed. Falls
+    back to shutil.rmtree where dir_fd is not supported.
+    
+    Returns:
+        Number of entries removed directly from path (its own top level)
+    
+    Raises:
+        OSError: If an entry cannot be removed
+    """
+    if not _HAVE_DIR_FD:
+        count = len(os.listdir(path))
+        shutil.rmtree(path)
+        return count
+    
+    flags = os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW
+    root_fd = os.open(path, flags)
+    # Frames of (dir_fd, scandir iterator, name in parent directory)
+    stack = [(root_fd, os.scandir(root_fd), path)]
+    count = 0
+    try:
+        while stack:
+            fd, entries, _ = stack[-1]
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    child_fd = os.open(entry.name, flags, dir_fd=fd)
+                    stack.append((child_fd, os.scandir(child_fd), entry.name))
+                    break
+                os.unlink(entry.name, dir_fd=fd)
+                if fd == root_fd:
+                    count += 1
+            else:
+                _, _, name = stack.pop()
+                entries.close()
+                os.close(fd)
+                if stack:
+                    os.rmdir(name, dir_fd=stack[-1][0])
+                    if len(stack) == 1:
+                        count += 1
+    finally:
+        for fd, entries, _ in stack:
+            entries.close()
+            os.close(fd)
+    os.rmdir(path)
+    return count
+
+
+def _is_locked_worktree(worktree_path: str) -> bool:
+    """Check whether git holds a lock on a worktree.
+    
+    The lock is a `locked` file in the worktree's admin directory, which the
+    worktree's .git file points to, so no git process is needed. A worktree
+    whose .git file cannot be read (e.g. the directory is already gone) is
+    treated as locked.
+    """
+    try:
+        with open(os.path.join(worktree_path, ".git"), "rb") as f:
+            content = f.read().strip()
+    except OSError:
+        return True
+    if not content.startswith(b"gitdir: "):
+        return True
+    admin_dir = os.path.join(worktree_path, os.fsdecode(content[len(b"gitdir: "):]))
+    return os.path.exists(os.path.join(admin_dir, "locked"))
+
+
 def remove_worktree(worktree_path: str, dry_run: bool = False) -> Tuple[bool, str]:
-    """Remove a worktree.
+    """Remove a worktree directory.
+    
+    The directory is deleted directly rather than through one
+    `git worktree remove` process per worktree; main() runs a single
+    `git worktree prune` afterwards to drop git's metadata for all of them.
+    Prune skips locked worktrees, so those are unlocked first.
     
     Returns:
         (success, message)
@@ -162,75 +305,92 @@ def remove_worktree(worktree_path: str, dry_run: bool = False) -> Tuple[bool, st
     if dry_run:
         return True, f"[DRY RUN] Would remove worktree: {worktree_path}"
     
-    try:
-        result = subprocess.run(
-            ["git", "worktree", "remove", worktree_path, "--force"],
+    if _is_locked_worktree(worktree_path):
+        # Fails harmlessly if the path is not registered or not locked
+        subprocess.run(
+            ["git", "worktree", "unlock", worktree_path],
             capture_output=True,
-            text=True,
-            check=True
+            cwd=PROJECT_ROOT,
         )
-        return True, f"Removed worktree: {worktree_path}"
-    except subprocess.CalledProcessError as e:
-        # Try manual removal if git worktree remove fails
-        if os.path.exists(worktree_path):
-            try:
-                shutil.rmtree(worktree_path)
-                return True, f"Manually removed worktree: {worktree_path}"
-            except Exception as manual_error:
-                return False, f"Failed to remove {worktree_path}: {e.stderr}, manual cleanup failed: {manual_error}"
-        return False, f"Failed to remove {worktree_path}: {e.stderr}"
+    
+    try:
+        _fast_rmtree(worktree_path)
+    except FileNotFoundError:
+        # Already gone; the prune still cleans up git's entry for it
+        pass
+    except OSError as e:
+        return False, f"Failed to remove {worktree_path}: {e}"
+    return True, f"Removed worktree: {worktree_path}"
 
 
 def remove_state_and_artifacts(adw_id: str, dry_run: bool = False) -> Tuple[bool, str, int]:
     """Remove state file and all agent artifacts for an ADW ID.
     
+    The whole agents/<adw_id>/ directory is removed in one pass.
+    
     Returns:
         (success, message, items_removed_count)
     """
-    project_root = get_project_root()
-    agents_dir = os.path.join(project_root, "agents", adw_id)
+    agents_dir = os.path.join(AGENTS_DIR, adw_id)
     
     if not os.path.exists(agents_dir):
         return True, f"No agents directory found for {adw_id}", 0
     
     if dry_run:
-        artifacts = get_agent_artifacts(adw_id)
-        state_file = os.path.join(agents_dir, "adw_state.json")
-        count = len(artifacts) + (1 if os.path.exists(state_file) else 0)
+        count = len(os.listdir(agents_dir))
         return True, f"[DRY RUN] Would remove {count} item(s) from agents/{adw_id}/", count
     
-    removed_count = 0
-    errors = []
+    try:
+        removed_count = _fast_rmtree(agents_dir)
+    except OSError as e:
+        return False, f"Failed to remove agents/{adw_id}/: {e}", 0
     
-    # Remove agent artifacts
-    artifacts = get_agent_artifacts(adw_id)
-    for artifact_path in artifacts:
-        try:
-            shutil.rmtree(artifact_path)
-            removed_count += 1
-        except Exception as e:
-            errors.append(f"Failed to remove {artifact_path}: {e}")
-    
-    # Remove state file
-    state_file = os.path.join(agents_dir, "adw_state.json")
-    if os.path.exists(state_file):
-        try:
-            os.remove(state_file)
-            removed_count += 1
-        except Exception as e:
-            errors.append(f"Failed to remove {state_file}: {e}")
+    return True, f"Removed {removed_count} item(s) from agents/{adw_id}/", removed_count
+
+
+def _cleanup_one(adw_id: str, worktrees: List[Tuple[str, str]], args: argparse.Namespace) -> Dict[str, Any]:
+    """Clean the worktree, state file, and artifacts for one ADW ID.
     
-    # Remove agents directory if empty
-    try:
-        if os.path.exists(agents_dir) and not os.listdir(agents_dir):
-            os.rmdir(agents_dir)
-    except Exception:
-        pass  # Ignore errors removing empty directory
+    Args:
+        adw_id: The ADW ID to clean
+        worktrees: All (adw_id, worktree_path) pairs from get_worktrees()
+        args: Parsed command line arguments (dry_run, states_only, worktrees_only)
     
-    if errors:
-        return False, f"Partial cleanup: {removed_count} removed, errors: {'; '.join(errors)}", removed_count
+    Returns:
+        Dict with removed/failed counts and the messages to print
+    """
+    result: Dict[str, Any] = {
+        "worktrees_removed": 0,
+        "worktrees_failed": 0,
+        "states_removed": 0,
+        "states_failed": 0,
+        "items_removed": 0,
+        "messages": [],
+    }
+    
+    # Clean worktrees
+    if not args.states_only:
+        matching_worktrees = [wt for wt in worktrees if wt[0] == adw_id]
+        
+        for _, wt_path in matching_worktrees:
+            success, message = remove_worktree(wt_path, dry_run=args.dry_run)
+            result["messages"].append(message)
+            if success:
+                result["worktrees_removed"] += 1
+            else:
+                result["worktrees_failed"] += 1
+    
+    # Clean state files and artifacts
+    if not args.worktrees_only:
+        success, message, items_count = remove_state_and_artifacts(adw_id, dry_run=args.dry_run)
+        result["messages"].append(message)
+        if success:
+            result["states_removed"] += 1
+            result["items_removed"] += items_count
+        else:
+            result["states_failed"] += 1
     
-    return True, f"Removed {removed_count} item(s) from agents/{adw_id}/", removed_count
+    return result
 
 
 def main():
@@ -291,6 +451,12 @@ Examples:
         action="store_true",
         help="Skip ADW IDs that appear to be actively running (modified in last 24h)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of ADW IDs to stat and clean in parallel (default: up to 16 for stats, 32 for cleanup; 1 disables parallelism)"
+    )
     
     args = parser.parse_args()
     
@@ -298,16 +464,38 @@ Examples:
         print("Error: --worktrees-only and --states-only cannot be used together")
         return 1
     
-    # Get all ADW IDs from worktrees and state files
-    worktrees = get_worktrees()
-    state_files = get_state_files()
-    
-    # Combine all ADW IDs
     all_adw_ids: Set[str] = set()
-    for adw_id, _ in worktrees:
-        all_adw_ids.add(adw_id)
-    for adw_id, _ in state_files:
-        all_adw_ids.add(adw_id)
+    if args.adw_id and not args.all:
+        # Targeted cleanup: check this ID's paths directly instead of listing
+        # every worktree (a git process) and every state file
+        if not is_valid_adw_id(args.adw_id):
+            print(f"Error: Invalid ADW ID '{args.adw_id}'")
+            return 1
+        worktree_path = os.path.join(TREES_DIR, args.adw_id)
+        state_file = os.path.join(AGENTS_DIR, args.adw_id, "adw_state.json")
+        worktrees = [(args.adw_id, worktree_path)] if _stat(worktree_path) is not None else []
+        if not worktrees and _stat(state_file) is None:
+            print(f"Error: ADW ID '{args.adw_id}' not found")
+            return 1
+        all_adw_ids.add(args.adw_id)
+    else:
+        # Get all ADW IDs from worktrees and state files
+        worktrees = get_worktrees()
+        state_files = get_state_files()
+        
+        # Combine all ADW IDs
+        for adw_id, _ in worktrees:
+            all_adw_ids.add(adw_id)
+        for adw_id, _ in state_files:
+            all_adw_ids.add(adw_id)
+        
+        # Stat every worktree and state file up front, in parallel; the
+        # filters and the report below then read from the stat cache
+        _prefetch_stats(
+            [os.path.join(TREES_DIR, adw_id) for adw_id in all_adw_ids]
+            + [os.path.join(AGENTS_DIR, adw_id, "adw_state.json") for adw_id in all_adw_ids],
+            args.jobs or 16,
+        )
     
     if not all_adw_ids:
         print("No ADW worktrees or state files found")
@@ -342,15 +530,15 @@ Examples:
         
         for adw_id in all_adw_ids:
             # Check worktree age
-            worktree_path = os.path.join(get_project_root(), "trees", adw_id)
-            if os.path.exists(worktree_path):
+            worktree_path = os.path.join(TREES_DIR, adw_id)
+            if _stat(worktree_path) is not None:
                 if get_file_age(worktree_path) >= cutoff_age:
                     to_clean.add(adw_id)
                     continue
             
             # Check state file age
-            state_file = os.path.join(get_project_root(), "agents", adw_id, "adw_state.json")
-            if os.path.exists(state_file):
+            state_file = os.path.join(AGENTS_DIR, adw_id, "adw_state.json")
+            if _stat(state_file) is not None:
                 if get_file_age(state_file) >= cutoff_age:
                     to_clean.add(adw_id)
         
@@ -363,11 +551,11 @@ Examples:
     # Display what will be cleaned
     print("\nADW IDs to clean:")
     for adw_id in sorted(to_clean):
-        worktree_path = os.path.join(get_project_root(), "trees", adw_id)
-        state_file = os.path.join(get_project_root(), "agents", adw_id, "adw_state.json")
+        worktree_path = os.path.join(TREES_DIR, adw_id)
+        state_file = os.path.join(AGENTS_DIR, adw_id, "adw_state.json")
         
-        worktree_age = get_file_age(worktree_path) if os.path.exists(worktree_path) else None
-        state_age = get_file_age(state_file) if os.path.exists(state_file) else None
+        worktree_age = get_file_age(worktree_path) if _stat(worktree_path) is not None else None
+        state_age = get_file_age(state_file) if _stat(state_file) is not None else None
         
         info_parts = []
         if worktree_age is not None:
@@ -377,38 +565,28 @@ Examples:
         
         print(f"  - {adw_id}: {', '.join(info_parts) if info_parts else 'no files found'}")
     
-    # Perform cleanup
-    worktrees_removed = 0
-    worktrees_failed = 0
-    states_removed = 0
-    states_failed = 0
-    total_items_removed = 0
-    
-    for adw_id in sorted(to_clean):
+    # Perform cleanup; ADW IDs are independent, so they are cleaned in
+    # parallel and their output is printed in sorted order
+    jobs = args.jobs or min(32, len(to_clean))
+    ordered_ids = sorted(to_clean)
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(
+                lambda adw_id: _cleanup_one(adw_id, worktrees, args), ordered_ids
+            ))
+    else:
+        results = [_cleanup_one(adw_id, worktrees, args) for adw_id in ordered_ids]
+
+    worktrees_removed = sum(r["worktrees_removed"] for r in results)
+    worktrees_failed = sum(r["worktrees_failed"] for r in results)
+    states_removed = sum(r["states_removed"] for r in results)
+    states_failed = sum(r["states_failed"] for r in results)
+    total_items_removed = sum(r["items_removed"] for r in results)
+
+    for adw_id, result in zip(ordered_ids, results):
         print(f"\nCleaning {adw_id}...")
-        
-        # Clean worktrees
-        if not args.states_only:
-            worktree_path = os.path.join(get_project_root(), "trees", adw_id)
-            matching_worktrees = [wt for wt in worktrees if wt[0] == adw_id]
-            
-            for _, wt_path in matching_worktrees:
-                success, message = remove_worktree(wt_path, dry_run=args.dry_run)
-                print(f"  {message}")
-                if success:
-                    worktrees_removed += 1
-                else:
-                    worktrees_failed += 1
-        
-        # Clean state files and artifacts
-        if not args.worktrees_only:
-            success, message, items_count = remove_state_and_artifacts(adw_id, dry_run=args.dry_run)
-        print(f"  {message}")
-        if success:
-                states_removed += 1
-                total_items_removed += items_count
-        else:
-                states_failed += 1
+        for message in result["messages"]:
+            print(f"  {message}")
     
     # Summary
     print(f"\n{'='*60}")
@@ -423,7 +601,7 @@ Examples:
     if not args.dry_run and worktrees_removed > 0:
         try:
             subprocess.run(["git", "worktree", "prune"], check=False, capture_output=True)
-        print("Ran 'git worktree prune' to clean up stale entries")
+            print("Ran 'git worktree prune' to clean up stale entries")
         except Exception:
             pass
     
@@ -9,6 +9,18 @@ from rococo.models.versioned_model import ModelValidationError
 from rococo.models import LoginMethod as BaseLoginMethod
 
 
+PASSWORD_ALLOWED_SYMBOLS = frozenset('!@#$%&()-_[]{};:"./<>?^*`~\',|=+ ')
+PASSWORD_ALLOWED_CHARACTERS = frozenset(string.ascii_letters + string.digits) | PASSWORD_ALLOWED_SYMBOLS
+
+# Character classes a password must contain at least one of, in error order
+PASSWORD_REQUIRED_CHARACTERS = (
+    (frozenset(string.ascii_uppercase), "Password must contain a uppercase letter"),
+    (frozenset(string.ascii_lowercase), "Password must contain a lowercase letter"),
+    (frozenset(string.digits), "Password must contain a digit"),
+    (PASSWORD_ALLOWED_SYMBOLS, "Password must contain a special character"),
+)
+
+
 @dataclass
 class LoginMethod(BaseLoginMethod):
 
@@ -25,9 +37,6 @@ class LoginMethod(BaseLoginMethod):
         del self.raw_password
 
     def validate_raw_password(self):
-        allowed_symbols = '!@#$%&()-_[]{};:"./<>?^*`~\',|=+ '
-        whitelist = list(string.ascii_uppercase) + list(string.ascii_lowercase) + list(string.digits) + list(allowed_symbols)
-
         if self.raw_password is None:
             return
         
@@ -37,15 +46,10 @@ class LoginMethod(BaseLoginMethod):
             errors.append("Password must be at least 8 character long")
         if len(self.raw_password) > 100:
             errors.append("Password must be at max 100 character long")
-        if not any(x in unique_v for x in string.ascii_uppercase):
-            errors.append("Password must contain a uppercase letter")
-        if not any(x in unique_v for x in string.ascii_lowercase):
-            errors.append("Password must contain a lowercase letter")
-        if not any(x in unique_v for x in string.digits):
-            errors.append("Password must contain a digit")
-        if not any(x in unique_v for x in allowed_symbols):
-            errors.append("Password must contain a special character")
-        if not all(x in whitelist for x in unique_v):
+        for required_characters, message in PASSWORD_REQUIRED_CHARACTERS:
+            if unique_v.isdisjoint(required_characters):
+                errors.append(message)
+        if not unique_v <= PASSWORD_ALLOWED_CHARACTERS:
             errors.append("Password contains an invalid character")
 
         if errors:
@@ -1,8 +1,15 @@
+from http.cookiejar import DefaultCookiePolicy
+
 import requests
 from common.app_config import config
 from common.app_logger import logger
 import jwt
 
+# Shared across requests so connections (and TLS sessions) to the OAuth providers are reused.
+# Cookies are never stored, so nothing set during one user's exchange is sent with another's.
+_http_session = requests.Session()
+_http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
 
 class OAuthClient:
     def __init__(self, config):
@@ -36,7 +43,7 @@ class OAuthClient:
         logger.info(f"Google OAuth token request data: {token_data}")
         
         try:
-            response = requests.post(token_url, data=token_data)
+            response = _http_session.post(token_url, data=token_data)
             logger.info(f"Google OAuth response status: {response.status_code}")
             logger.info(f"Google OAuth response: {response.text}")
             
@@ -69,7 +76,7 @@ class OAuthClient:
             'Authorization': f'Bearer {access_token}'
         }
 
-        response = requests.get(userinfo_url, headers=headers)
+        response = _http_session.get(userinfo_url, headers=headers)
         logger.info(response.json())
         response.raise_for_status()
         
@@ -93,7 +100,7 @@ class OAuthClient:
 
         logger.info(token_data)
 
-        response = requests.post(token_url, data=token_data)
+        response = _http_session.post(token_url, data=token_data)
         logger.info(response.json())
         response.raise_for_status()
         return response.json()
@@ -113,7 +120,7 @@ class OAuthClient:
             'Authorization': f'Bearer {access_token}'
         }
 
-        response = requests.get(userinfo_url, headers=headers)
+        response = _http_session.get(userinfo_url, headers=headers)
         logger.info(response.json())
         response.raise_for_status()
         
@@ -1,13 +1,12 @@
 from common.repositories.factory import RepositoryFactory, RepoType
 from common.models.person import Person
+from common.services.email import EmailService
 
 
 class PersonService:
 
     def __init__(self, config):
         self.config = config
-
-        from common.services import EmailService
         self.email_service = EmailService(config)
 
         self.repository_factory = RepositoryFactory(config)
@@ -1,23 +1,35 @@
 import tomllib
 import os
+from functools import lru_cache
 
 # Locate the correct pyproject.toml (flask/pyproject.toml)
 # common/utils/version.py -> common/utils -> common -> root
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 FLASK_TOML = os.path.join(BASE_DIR, 'flask', 'pyproject.toml')
+# In the Docker image flask/ is copied to the root, next to common/
+ROOT_TOML = os.path.join(BASE_DIR, 'pyproject.toml')
 
-target_file = FLASK_TOML if os.path.exists(FLASK_TOML) else 'pyproject.toml'
 
-with open(target_file, 'rb') as f:
-    pyproject_data = tomllib.load(f)
+@lru_cache(maxsize=1)
+def _load_pyproject():
+    target_file = FLASK_TOML if os.path.exists(FLASK_TOML) else ROOT_TOML
+    with open(target_file, 'rb') as f:
+        return tomllib.load(f)
+
+
+def __getattr__(name):
+    # pyproject_data is parsed on first access rather than at import
+    if name == 'pyproject_data':
+        return _load_pyproject()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_service_version():
-    return pyproject_data['tool']['poetry']['version']
+    return _load_pyproject()['tool']['poetry']['version']
 
 
 def get_project_name():
-    return pyproject_data['tool']['poetry']['name'].title()
+    return _load_pyproject()['tool']['poetry']['name'].title()
 
 
 def main():
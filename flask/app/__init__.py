@@ -7,6 +7,7 @@ from rococo.plugins.pooled_connection import PooledConnectionPlugin
 from rococo.models.versioned_model import ModelValidationError
 
 from common.helpers.exceptions import InputValidationError, APIException
+from app.helpers.json_provider import OrjsonProvider
 
 from common.app_config import get_config
 from common.utils.version import get_service_version, get_project_name
@@ -29,6 +30,7 @@ def create_app():
 
     app = Flask(__name__)
     app.config.from_object(config)
+    app.json = OrjsonProvider(app)
 
     with app.app_context():
         set_request_exception_signal(app)
@@ -56,6 +56,9 @@ def login_required():
 
 
 def organization_required(with_roles=None):
+    # Built once when the view is decorated (at import), not on every request
+    allowed_roles = frozenset(with_roles) if with_roles is not None else None
+
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
@@ -83,8 +86,8 @@ def organization_required(with_roles=None):
                 return get_failure_response(message="User is not authorized to use this organization.", status_code=401)
 
             # If with_roles is specified, verify the user's role is allowed.
-            if with_roles is not None:
-                if person_organization_role.role not in with_roles:
+            if allowed_roles is not None:
+                if person_organization_role.role not in allowed_roles:
                     return get_failure_response(
                         message="User is not authroized to perform this operation on this organization.",
                         status_code=403
@@ -0,0 +1,16 @@
+revision = "0000000006"
+down_revision = "0000000005"
+
+
+
+def upgrade(migration):
+    # person_id lookups are served by the (person_id, organization_id) index prefix
+    migration.remove_index("person_organization_role", "person_organization_role_person_id_ind")
+
+    migration.update_version_table(version=revision)
+
+
+def downgrade(migration):
+    migration.add_index("person_organization_role", "person_organization_role_person_id_ind", "person_id")
+
+    migration.update_version_table(version=down_revision)
@@ -1,13 +1,30 @@
-from flask_restx import Namespace, Resource
+from flask_restx import Namespace, Resource, fields
 from flask import request
 from app.helpers.response import get_success_response, get_failure_response, parse_request_body, validate_required_fields
 from app.helpers.decorators import login_required
 from common.app_config import config
-from common.services import AuthService, PersonService, OAuthClient
+from common.services import AuthService, OAuthClient
 
 # Create the auth blueprint
 auth_api = Namespace('auth', description="Auth related APIs")
 
+# Request body models, built once at import
+signup_model = auth_api.model('Signup', {
+    'first_name': fields.String,
+    'last_name': fields.String,
+    'email_address': fields.String
+})
+login_model = auth_api.model('Login', {
+    'email': fields.String,
+    'password': fields.String
+})
+forgot_password_model = auth_api.model('ForgotPassword', {
+    'email': fields.String
+})
+reset_password_model = auth_api.model('ResetPassword', {
+    'password': fields.String
+})
+
 
 @auth_api.route('/test')
 class Test(Resource):
@@ -21,13 +38,7 @@ class Test(Resource):
 
 @auth_api.route('/signup')
 class Signup(Resource):
-    @auth_api.expect(
-        {'type': 'object', 'properties': {
-            'first_name': {'type': 'string'},
-            'last_name': {'type': 'string'},
-            'email_address': {'type': 'string'}
-        }}
-    )
+    @auth_api.expect(signup_model)
     def post(self):
         parsed_body = parse_request_body(request, ['first_name', 'last_name', 'email_address'])
         validate_required_fields(parsed_body)
@@ -44,12 +55,7 @@ class Signup(Resource):
 
 @auth_api.route('/login')
 class Login(Resource):
-    @auth_api.expect(
-        {'type': 'object', 'properties': {
-            'email': {'type': 'string'},
-            'password': {'type': 'string'}
-        }}
-    )
+    @auth_api.expect(login_model)
     def post(self):
         parsed_body = parse_request_body(request, ['email', 'password'])
         validate_required_fields(parsed_body)
@@ -60,19 +66,14 @@ class Login(Resource):
             parsed_body['password']
         )
 
-        person_service = PersonService(config)
-        person = person_service.get_person_by_email_address(email_address=parsed_body['email'])
+        person = auth_service.person_service.get_person_by_email_address(email_address=parsed_body['email'])
 
         return get_success_response(person=person.as_dict(), access_token=access_token, expiry=expiry)
 
 
 @auth_api.route('/forgot_password', doc=dict(description="Send reset password link"))
 class ForgotPassword(Resource):
-    @auth_api.expect(
-        {'type': 'object', 'properties': {
-            'email': {'type': 'string'}
-        }}
-    )
+    @auth_api.expect(forgot_password_model)
     def post(self):
         parsed_body = parse_request_body(request, ['email'])
         validate_required_fields(parsed_body)
@@ -88,11 +89,7 @@ class ForgotPassword(Resource):
     doc=dict(description="Update the password using reset password link")
 )
 class ResetPassword(Resource):
-    @auth_api.expect(
-        {'type': 'object', 'properties': {
-            'password': {'type': 'string'}
-        }}
-    )
+    @auth_api.expect(reset_password_model)
     def post(self, token, uidb64):
         parsed_body = parse_request_body(request, ['password'])
         validate_required_fields(parsed_body)
@@ -107,6 +104,13 @@ class ResetPassword(Resource):
         )
 
 
+# OAuthClient (token exchange, user info) method names per provider
+OAUTH_PROVIDERS = {
+    "google": ("get_google_token", "get_google_user_info"),
+    "microsoft": ("get_microsoft_token", "get_microsoft_user_info"),
+}
+
+
 @auth_api.route('/<string:provider>/exchange')
 class OAuthExchange(Resource):
     def post(self, provider):
@@ -122,29 +126,21 @@ class OAuthExchange(Resource):
         )
         validate_required_fields(parsed_body)
 
+        if provider not in OAUTH_PROVIDERS:
+            return get_failure_response(message=f"Unsupported provider: {provider}")
+        get_token, get_user_info = OAUTH_PROVIDERS[provider]
+
         oauth_client = OAuthClient(config)
         auth_service = AuthService(config)
 
         try:
             # Token exchange + user info retrieval
-            if provider == "google":
-                token_response = oauth_client.get_google_token(
-                    parsed_body['code'],
-                    parsed_body['redirect_uri'],
-                    parsed_body['code_verifier']
-                )
-                user_info = oauth_client.get_google_user_info(token_response['access_token'])
-
-            elif provider == "microsoft":
-                token_response = oauth_client.get_microsoft_token(
-                    parsed_body['code'],
-                    parsed_body['redirect_uri'],
-                    parsed_body['code_verifier']
-                )
-                user_info = oauth_client.get_microsoft_user_info(token_response['access_token'])
-
-            else:
-                return get_failure_response(message=f"Unsupported provider: {provider}")
+            token_response = getattr(oauth_client, get_token)(
+                parsed_body['code'],
+                parsed_body['redirect_uri'],
+                parsed_body['code_verifier']
+            )
+            user_info = getattr(oauth_client, get_user_info)(token_response['access_token'])
 
             # Normalize name + email (same structure for both google and microsoft)
             email = user_info.get('email')
@@ -153,8 +149,7 @@ class OAuthExchange(Resource):
             if not email:
                 return get_failure_response(message=f"{provider.capitalize()} user info does not contain email.")
 
-            name_parts = name.split(' ', 1)
-            first_name, last_name = name_parts[0], name_parts[1] if len(name_parts) > 1 else ""
+            first_name, _, last_name = name.partition(' ')
 
             # Login or create user
             access_token, expiry, person = auth_service.login_user_by_oauth(
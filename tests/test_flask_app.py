@@ -3,28 +3,31 @@ Unit tests for flask/app/__init__.py
 """
 import pytest
 import sys
-import os
 import importlib.util
+from pathlib import Path
 from unittest.mock import MagicMock, patch, Mock
 from flask import Flask as FlaskApp
 from rococo.models.versioned_model import ModelValidationError
 from common.helpers.exceptions import InputValidationError, APIException
 
-# Load the project's flask.app module using importlib to bypass naming conflict
-flask_app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'flask', 'app', '__init__.py')
-spec = importlib.util.spec_from_file_location("project_flask_app", flask_app_path)
-project_flask_app = importlib.util.module_from_spec(spec)
+@pytest.fixture(scope="session")
+def project_flask_app():
+    """Load the project's flask.app module using importlib to bypass naming conflict."""
+    flask_app_path = Path(__file__).resolve().parents[1] / 'flask' / 'app' / '__init__.py'
+    spec = importlib.util.spec_from_file_location("project_flask_app", flask_app_path)
+    module = importlib.util.module_from_spec(spec)
 
-# We need to patch app.views before executing the module
-with patch.dict('sys.modules', {'app.views': MagicMock()}):
-    spec.loader.exec_module(project_flask_app)
+    # We need to patch app.views before executing the module
+    with patch.dict('sys.modules', {'app.views': MagicMock()}):
+        spec.loader.exec_module(module)
+    return module
 
 
 class TestCreateApp:
     """Tests for create_app function."""
 
     @patch('common.app_config.get_config')
-    def test_create_app_returns_flask_instance(self, mock_get_config):
+    def test_create_app_returns_flask_instance(self, mock_get_config, project_flask_app):
         """Test that create_app returns a Flask application instance."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -39,7 +42,7 @@ class TestCreateApp:
         assert app is not None
 
     @patch('common.app_config.get_config')
-    def test_create_app_initializes_cors(self, mock_get_config):
+    def test_create_app_initializes_cors(self, mock_get_config, project_flask_app):
         """Test that create_app initializes CORS."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -53,7 +56,7 @@ class TestCreateApp:
         mock_cors.assert_called_once()
 
     @patch('common.app_config.get_config')
-    def test_create_app_initializes_pooled_connection(self, mock_get_config):
+    def test_create_app_initializes_pooled_connection(self, mock_get_config, project_flask_app):
         """Test that create_app initializes PooledConnectionPlugin."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -69,7 +72,7 @@ class TestCreateApp:
         assert call_args[1]['database_type'] == "postgres"
 
     @patch('common.app_config.get_config')
-    def test_create_app_registers_views(self, mock_get_config):
+    def test_create_app_registers_views(self, mock_get_config, project_flask_app):
         """Test that create_app registers views."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -82,7 +85,7 @@ class TestCreateApp:
             mock_views.initialize_views.assert_called_once()
 
     @patch('common.app_config.get_config')
-    def test_create_app_root_route(self, mock_get_config):
+    def test_create_app_root_route(self, mock_get_config, project_flask_app):
         """Test that root route returns welcome message."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -100,7 +103,7 @@ class TestCreateApp:
                 assert response.status_code in [200, 404]
 
     @patch('common.app_config.get_config')
-    def test_create_app_root_route_returns_welcome_message(self, mock_get_config):
+    def test_create_app_root_route_returns_welcome_message(self, mock_get_config, project_flask_app):
         """Test that root route returns correct welcome message (line 49)."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -126,7 +129,7 @@ class TestCreateApp:
                 assert result == 'Welcome to Rococo Sample API.'
 
     @patch('common.app_config.get_config')
-    def test_create_app_model_validation_error_handler(self, mock_get_config):
+    def test_create_app_model_validation_error_handler(self, mock_get_config, project_flask_app):
         """Test that ModelValidationError handler is registered."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -143,7 +146,7 @@ class TestCreateApp:
         assert 'ModelValidationError' in handler_classes
 
     @patch('common.app_config.get_config')
-    def test_create_app_input_validation_error_handler(self, mock_get_config):
+    def test_create_app_input_validation_error_handler(self, mock_get_config, project_flask_app):
         """Test that InputValidationError handler is registered."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -160,7 +163,7 @@ class TestCreateApp:
         assert 'InputValidationError' in handler_classes
 
     @patch('common.app_config.get_config')
-    def test_create_app_api_exception_handler(self, mock_get_config):
+    def test_create_app_api_exception_handler(self, mock_get_config, project_flask_app):
         """Test that APIException handler is registered."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -176,7 +179,7 @@ class TestCreateApp:
         handler_classes = [cls.__name__ for cls in error_handlers.keys() if cls is not None]
         assert 'APIException' in handler_classes
 
-    def test_create_app_sets_config(self):
+    def test_create_app_sets_config(self, project_flask_app):
         """Test that create_app sets config from get_config."""
         mock_config = MagicMock()
         mock_config.TEST_VALUE = 'test'
@@ -190,7 +193,7 @@ class TestCreateApp:
         mock_get_config.assert_called_once()
 
     @patch('common.app_config.get_config')
-    def test_error_handler_execution_model_validation_error(self, mock_get_config):
+    def test_error_handler_execution_model_validation_error(self, mock_get_config, project_flask_app):
         """Test that ModelValidationError handler executes its body."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -216,7 +219,7 @@ class TestCreateApp:
                 assert 'message' in str(call_args)
 
     @patch('common.app_config.get_config')
-    def test_error_handler_execution_input_validation_error(self, mock_get_config):
+    def test_error_handler_execution_input_validation_error(self, mock_get_config, project_flask_app):
         """Test that InputValidationError handler executes its body."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
@@ -242,7 +245,7 @@ class TestCreateApp:
                 assert 'Invalid input provided' in str(call_args)
 
     @patch('common.app_config.get_config')
-    def test_error_handler_execution_api_exception(self, mock_get_config):
+    def test_error_handler_execution_api_exception(self, mock_get_config, project_flask_app):
         """Test that APIException handler executes its body."""
         mock_config = MagicMock()
         mock_get_config.return_value = mock_config
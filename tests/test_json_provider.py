@@ -0,0 +1,77 @@
+"""
+Unit tests for flask/app/helpers/json_provider.py
+"""
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+
+@dataclass
+class _Sample:
+    name: str
+    created: datetime
+
+
+@pytest.fixture
+def providers():
+    """OrjsonProvider and DefaultJSONProvider bound to the same app."""
+    from app.helpers.json_provider import OrjsonProvider
+
+    app = Flask(__name__)
+    return OrjsonProvider(app), DefaultJSONProvider(app)
+
+
+class TestOrjsonProvider:
+    """Tests for OrjsonProvider."""
+
+    def test_dumps_matches_default_provider(self, providers):
+        """Test that encoded values match DefaultJSONProvider, including non-native types."""
+        orjson_provider, default_provider = providers
+        data = {
+            "success": True,
+            "b": [1, 2.5, None, "ü"],
+            "a": {"when": datetime(2024, 1, 2, 3, 4, 5), "day": date(2024, 1, 2)},
+            "amount": Decimal("1.10"),
+            "id": uuid.UUID("12345678123456781234567812345678"),
+            "sample": _Sample(name="x", created=datetime(2024, 1, 2)),
+        }
+
+        result = orjson_provider.dumps(data)
+
+        assert json.loads(result) == json.loads(default_provider.dumps(data))
+        assert list(json.loads(result)) == sorted(data)
+
+    def test_loads_bytes_and_str(self, providers):
+        """Test that JSON is decoded from bytes and str."""
+        orjson_provider, _ = providers
+
+        assert orjson_provider.loads(b'{"email": "a@b.c"}') == {"email": "a@b.c"}
+        assert orjson_provider.loads('[1, 2]') == [1, 2]
+
+    def test_loads_invalid_json_raises_value_error(self, providers):
+        """Test that invalid JSON raises a ValueError like json.loads."""
+        orjson_provider, _ = providers
+
+        with pytest.raises(ValueError):
+            orjson_provider.loads(b'{invalid')
+
+    def test_dumps_with_kwargs_uses_default_provider(self, providers):
+        """Test that json.dumps arguments such as indent fall back to DefaultJSONProvider."""
+        orjson_provider, default_provider = providers
+
+        assert orjson_provider.dumps({"a": 1}, indent=2) == default_provider.dumps({"a": 1}, indent=2)
+
+    def test_falls_back_without_orjson(self, providers):
+        """Test that the provider behaves like DefaultJSONProvider when orjson is not installed."""
+        orjson_provider, default_provider = providers
+
+        with patch('app.helpers.json_provider.orjson', None):
+            assert orjson_provider.dumps({"b": 1, "a": 2}) == default_provider.dumps({"b": 1, "a": 2})
+            assert orjson_provider.loads('{"a": 1}') == {"a": 1}
@@ -117,6 +117,27 @@ class TestLoginMethodValidateRawPassword:
 
         assert "invalid character" in str(exc_info.value)
 
+    @patch('common.models.login_method.BaseLoginMethod.__post_init__')
+    def test_password_reports_all_errors_in_order(self, mock_post_init):
+        """Test that every failed rule is reported, in rule order."""
+        from common.models.login_method import LoginMethod
+        from rococo.models.versioned_model import ModelValidationError
+
+        with pytest.raises(ModelValidationError) as exc_info:
+            LoginMethod(method_type='password', raw_password='€')  # NOSONAR - Test data with invalid char
+
+        message = str(exc_info.value)
+        expected = [
+            "at least 8 character",
+            "uppercase letter",
+            "lowercase letter",
+            "contain a digit",
+            "special character",
+            "invalid character",
+        ]
+        positions = [message.index(text) for text in expected]
+        assert positions == sorted(positions)
+
     @patch('common.models.login_method.generate_password_hash')
     @patch('common.models.login_method.BaseLoginMethod.__post_init__')
     def test_valid_password_passes(self, mock_post_init, mock_hash):
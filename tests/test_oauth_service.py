@@ -19,7 +19,7 @@ class TestOAuthClientInitialization:
 class TestGetGoogleToken:
     """Tests for get_google_token method."""
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_google_token_success(self, mock_post, mock_config):
         """Test successful Google token retrieval."""
         mock_response = Mock()
@@ -44,7 +44,7 @@ class TestGetGoogleToken:
         assert call_args[1]['data']['redirect_uri'] == 'http://localhost/callback'
         assert call_args[1]['data']['code_verifier'] == 'code_verifier'
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_google_token_error_response(self, mock_post, mock_config):
         """Test Google token retrieval with error response."""
         mock_response = Mock()
@@ -58,7 +58,7 @@ class TestGetGoogleToken:
         with pytest.raises(requests.exceptions.HTTPError):
             client.get_google_token('invalid_code', 'http://localhost/callback', 'code_verifier')
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_google_token_request_exception(self, mock_post, mock_config):
         """Test Google token retrieval with request exception."""
         mock_post.side_effect = requests.exceptions.RequestException('Connection error')
@@ -68,7 +68,7 @@ class TestGetGoogleToken:
         with pytest.raises(requests.exceptions.RequestException):
             client.get_google_token('auth_code', 'http://localhost/callback', 'code_verifier')
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_google_token_uses_config_credentials(self, mock_post, mock_config):
         """Test that get_google_token uses config credentials."""
         mock_config.GOOGLE_CLIENT_ID = 'test_client_id'
@@ -90,7 +90,7 @@ class TestGetGoogleToken:
 class TestGetGoogleUserInfo:
     """Tests for get_google_user_info method."""
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_google_user_info_success(self, mock_get, mock_config):
         """Test successful retrieval of Google user info."""
         mock_response = Mock()
@@ -115,7 +115,7 @@ class TestGetGoogleUserInfo:
             headers={'Authorization': 'Bearer access_token'}
         )
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_google_user_info_error(self, mock_get, mock_config):
         """Test Google user info retrieval with error."""
         mock_response = Mock()
@@ -128,7 +128,7 @@ class TestGetGoogleUserInfo:
         with pytest.raises(requests.exceptions.HTTPError):
             client.get_google_user_info('invalid_token')
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_google_user_info_uses_bearer_token(self, mock_get, mock_config):
         """Test that get_google_user_info uses Bearer token."""
         mock_response = Mock()
@@ -146,7 +146,7 @@ class TestGetGoogleUserInfo:
 class TestGetMicrosoftToken:
     """Tests for get_microsoft_token method."""
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_microsoft_token_success(self, mock_post, mock_config):
         """Test successful Microsoft token retrieval."""
         mock_response = Mock()
@@ -170,7 +170,7 @@ class TestGetMicrosoftToken:
         assert 'login.microsoftonline.com' in call_args[0][0]
         assert call_args[1]['data']['code'] == 'auth_code'
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_microsoft_token_error_response(self, mock_post, mock_config):
         """Test Microsoft token retrieval with error response."""
         mock_response = Mock()
@@ -184,7 +184,7 @@ class TestGetMicrosoftToken:
         with pytest.raises(requests.exceptions.HTTPError):
             client.get_microsoft_token('invalid_code', 'http://localhost/callback', 'code_verifier')
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_microsoft_token_uses_config_credentials(self, mock_post, mock_config):
         """Test that get_microsoft_token uses config credentials."""
         mock_config.MICROSOFT_CLIENT_ID = 'ms_client_id'
@@ -202,7 +202,7 @@ class TestGetMicrosoftToken:
         assert call_args[1]['data']['client_id'] == 'ms_client_id'
         assert call_args[1]['data']['client_secret'] == 'ms_client_secret'
 
-    @patch('common.services.oauth.requests.post')
+    @patch('common.services.oauth._http_session.post')
     def test_get_microsoft_token_includes_scope(self, mock_post, mock_config):
         """Test that get_microsoft_token includes User.Read scope."""
         mock_response = Mock()
@@ -220,7 +220,7 @@ class TestGetMicrosoftToken:
 class TestGetMicrosoftUserInfo:
     """Tests for get_microsoft_user_info method."""
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_microsoft_user_info_success(self, mock_get, mock_config):
         """Test successful retrieval of Microsoft user info."""
         mock_response = Mock()
@@ -244,7 +244,7 @@ class TestGetMicrosoftUserInfo:
             headers={'Authorization': 'Bearer access_token'}
         )
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_microsoft_user_info_with_mail_field(self, mock_get, mock_config):
         """Test Microsoft user info when using 'mail' field instead of 'userPrincipalName'."""
         mock_response = Mock()
@@ -264,7 +264,7 @@ class TestGetMicrosoftUserInfo:
         assert result['email'] == 'user@company.com'
         assert result['name'] == 'Test User'
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_microsoft_user_info_missing_display_name(self, mock_get, mock_config):
         """Test Microsoft user info with missing displayName."""
         mock_response = Mock()
@@ -281,7 +281,7 @@ class TestGetMicrosoftUserInfo:
         assert result['email'] == 'user@example.com'
         assert result['name'] == ''
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_microsoft_user_info_error(self, mock_get, mock_config):
         """Test Microsoft user info retrieval with error."""
         mock_response = Mock()
@@ -295,7 +295,7 @@ class TestGetMicrosoftUserInfo:
         with pytest.raises(requests.exceptions.HTTPError):
             client.get_microsoft_user_info('invalid_token')
 
-    @patch('common.services.oauth.requests.get')
+    @patch('common.services.oauth._http_session.get')
     def test_get_microsoft_user_info_uses_bearer_token(self, mock_get, mock_config):
         """Test that get_microsoft_user_info uses Bearer token."""
         mock_response = Mock()
@@ -311,3 +311,20 @@ class TestGetMicrosoftUserInfo:
 
         call_args = mock_get.call_args
         assert call_args[1]['headers']['Authorization'] == 'Bearer my_ms_token'
+
+
+class TestOAuthHttpSession:
+    """Tests for the shared HTTP session."""
+
+    def test_session_does_not_store_cookies(self):
+        """Test that cookies set by a provider are not kept for later requests."""
+        from requests.cookies import MockRequest, MockResponse
+        from common.services.oauth import _http_session
+
+        headers = MagicMock()
+        headers.get_all.side_effect = lambda name, default: ['sid=abc; Path=/'] if name == 'Set-Cookie' else default
+        request = requests.Request('POST', 'https://oauth2.googleapis.com/token').prepare()
+
+        _http_session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+        assert len(_http_session.cookies) == 0
@@ -11,7 +11,7 @@ class TestPersonServiceInitialization:
     """Tests for PersonService initialization."""
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_init_creates_repository_and_email_service(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test that __init__ creates person repository and email service."""
         mock_factory = mock_factory_class.return_value
@@ -28,7 +28,7 @@ class TestSavePerson:
     """Tests for save_person method."""
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_save_person_success(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test successful person save."""
         mock_repo = MagicMock()
@@ -50,7 +50,7 @@ class TestGetPersonByEmailAddress:
     """Tests for get_person_by_email_address method."""
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_get_person_by_email_address_found(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test getting person by email address when found."""
         mock_repo = MagicMock()
@@ -72,7 +72,7 @@ class TestGetPersonByEmailAddress:
         mock_repo.get_one.assert_called_once_with({"entity_id": "person-123"})
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_get_person_by_email_address_email_not_found(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test getting person when email doesn't exist."""
         mock_email_service = mock_email_service_class.return_value
@@ -87,7 +87,7 @@ class TestGetPersonByEmailAddress:
         assert result is None
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_get_person_by_email_address_person_not_found(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test getting person when email exists but person doesn't."""
         mock_repo = MagicMock()
@@ -110,7 +110,7 @@ class TestGetPersonById:
     """Tests for get_person_by_id method."""
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_get_person_by_id_found(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test getting person by ID when found."""
         mock_repo = MagicMock()
@@ -127,7 +127,7 @@ class TestGetPersonById:
         mock_repo.get_one.assert_called_once_with({"entity_id": "person-123"})
 
     @patch('common.services.person.RepositoryFactory')
-    @patch('common.services.EmailService')
+    @patch('common.services.person.EmailService')
     def test_get_person_by_id_not_found(self, mock_email_service_class, mock_factory_class, mock_config):
         """Test getting person by ID when not found."""
         mock_repo = MagicMock()